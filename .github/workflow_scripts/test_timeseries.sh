@@ -11,9 +11,11 @@ export CUDA_VISIBLE_DEVICES=0
 install_local_packages "common/[tests]" "core/[all,tests]" "features/" "tabular/[all,tests]" "timeseries/[all,tests]"
 
 cd timeseries/
+# --dist loadfile sends all tests from one file to the same worker, so fitted predictors shared through module- and
+# session-scoped fixtures (e.g., in the persist tests) are created once per file. Each worker gets its own temp dir.
 if [ -n "$ADDITIONAL_TEST_ARGS" ]
 then
-    python -m pytest --junitxml=results.xml --runslow "$ADDITIONAL_TEST_ARGS" tests
+    python -m pytest -n auto --dist loadfile --junitxml=results.xml --runslow "$ADDITIONAL_TEST_ARGS" tests
 else
-    python -m pytest --junitxml=results.xml --runslow tests
+    python -m pytest -n auto --dist loadfile --junitxml=results.xml --runslow tests
 fi
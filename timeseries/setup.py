@@ -51,6 +51,7 @@ extras_require = {
         "ruff>=0.0.285",
         "flaky>=3.7,<4",
         "pytest-timeout>=2.1,<3",
+        "pytest-xdist>=3,<4",
         "isort>=5.10",
         "black~=23.0",
     ],
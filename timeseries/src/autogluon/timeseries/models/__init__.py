@@ -1,62 +1,121 @@
-from .autogluon_tabular import DirectTabularModel, RecursiveTabularModel
-from .chronos import ChronosModel
-from .gluonts import (
-    DeepARModel,
-    DLinearModel,
-    PatchTSTModel,
-    SimpleFeedForwardModel,
-    TemporalFusionTransformerModel,
-    TiDEModel,
-    WaveNetModel,
-)
-from .local import (
-    ADIDAModel,
-    ARIMAModel,
-    AutoARIMAModel,
-    AutoCESModel,
-    AutoETSModel,
-    AverageModel,
-    CrostonClassicModel,
-    CrostonOptimizedModel,
-    CrostonSBAModel,
-    DynamicOptimizedThetaModel,
-    ETSModel,
-    IMAPAModel,
-    NaiveModel,
-    NPTSModel,
-    SeasonalAverageModel,
-    SeasonalNaiveModel,
-    ThetaModel,
-    ZeroModel,
-)
-
-__all__ = [
-    "ADIDAModel",
-    "ARIMAModel",
-    "AutoARIMAModel",
-    "AutoCESModel",
-    "AutoETSModel",
-    "AverageModel",
-    "CrostonClassicModel",
-    "CrostonSBAModel",
-    "CrostonOptimizedModel",
-    "DLinearModel",
-    "DeepARModel",
-    "DirectTabularModel",
-    "DynamicOptimizedThetaModel",
-    "ETSModel",
-    "IMAPAModel",
-    "ChronosModel",
-    "NPTSModel",
-    "NaiveModel",
-    "PatchTSTModel",
-    "RecursiveTabularModel",
-    "SeasonalAverageModel",
-    "SeasonalNaiveModel",
-    "SimpleFeedForwardModel",
-    "TemporalFusionTransformerModel",
-    "ThetaModel",
-    "TiDEModel",
-    "WaveNetModel",
-    "ZeroModel",
-]
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import sys
+from typing import TYPE_CHECKING, Iterable, Optional
+
+if TYPE_CHECKING:
+    from .autogluon_tabular import DirectTabularModel, RecursiveTabularModel
+    from .chronos import ChronosModel
+    from .gluonts import (
+        DeepARModel,
+        DLinearModel,
+        PatchTSTModel,
+        SimpleFeedForwardModel,
+        TemporalFusionTransformerModel,
+        TiDEModel,
+        WaveNetModel,
+    )
+    from .local import (
+        ADIDAModel,
+        ARIMAModel,
+        AutoARIMAModel,
+        AutoCESModel,
+        AutoETSModel,
+        AverageModel,
+        CrostonClassicModel,
+        CrostonOptimizedModel,
+        CrostonSBAModel,
+        DynamicOptimizedThetaModel,
+        ETSModel,
+        IMAPAModel,
+        NaiveModel,
+        NPTSModel,
+        SeasonalAverageModel,
+        SeasonalNaiveModel,
+        ThetaModel,
+        ZeroModel,
+    )
+
+# Model classes are imported lazily on first attribute access (PEP 562). This way, importing a lightweight model such
+# as NaiveModel does not pull in heavy dependencies (torch, transformers, gluonts, ...) used by other models.
+# Each name points to the submodule where the class is defined (e.g. baselines resolve to `.local.naive`). The
+# `statsforecast` library itself is only imported inside the methods of the models in `.local.statsforecast`.
+# Optional backends required by each model are checked with importlib.util.find_spec before the import is attempted.
+_TABULAR_DEPENDENCIES = ("mlforecast",)
+_CHRONOS_DEPENDENCIES = ("torch", "transformers")
+_GLUONTS_DEPENDENCIES = ("torch", "lightning", "gluonts")
+_STATSFORECAST_DEPENDENCIES = ("statsforecast",)
+
+_LAZY = {
+    "DirectTabularModel": (".autogluon_tabular", _TABULAR_DEPENDENCIES),
+    "RecursiveTabularModel": (".autogluon_tabular", _TABULAR_DEPENDENCIES),
+    "ChronosModel": (".chronos", _CHRONOS_DEPENDENCIES),
+    "DeepARModel": (".gluonts", _GLUONTS_DEPENDENCIES),
+    "DLinearModel": (".gluonts", _GLUONTS_DEPENDENCIES),
+    "PatchTSTModel": (".gluonts", _GLUONTS_DEPENDENCIES),
+    "SimpleFeedForwardModel": (".gluonts", _GLUONTS_DEPENDENCIES),
+    "TemporalFusionTransformerModel": (".gluonts", _GLUONTS_DEPENDENCIES),
+    "TiDEModel": (".gluonts", _GLUONTS_DEPENDENCIES),
+    "WaveNetModel": (".gluonts", _GLUONTS_DEPENDENCIES),
+    "ADIDAModel": (".local.statsforecast", _STATSFORECAST_DEPENDENCIES),
+    "ARIMAModel": (".local.statsforecast", _STATSFORECAST_DEPENDENCIES),
+    "AutoARIMAModel": (".local.statsforecast", _STATSFORECAST_DEPENDENCIES),
+    "AutoCESModel": (".local.statsforecast", _STATSFORECAST_DEPENDENCIES),
+    "AutoETSModel": (".local.statsforecast", _STATSFORECAST_DEPENDENCIES),
+    "AverageModel": (".local.naive", ()),
+    "CrostonClassicModel": (".local.statsforecast", _STATSFORECAST_DEPENDENCIES),
+    "CrostonOptimizedModel": (".local.statsforecast", _STATSFORECAST_DEPENDENCIES),
+    "CrostonSBAModel": (".local.statsforecast", _STATSFORECAST_DEPENDENCIES),
+    "DynamicOptimizedThetaModel": (".local.statsforecast", _STATSFORECAST_DEPENDENCIES),
+    "ETSModel": (".local.statsforecast", _STATSFORECAST_DEPENDENCIES),
+    "IMAPAModel": (".local.statsforecast", _STATSFORECAST_DEPENDENCIES),
+    "NaiveModel": (".local.naive", ()),
+    "NPTSModel": (".local.npts", ("gluonts",)),
+    "SeasonalAverageModel": (".local.naive", ()),
+    "SeasonalNaiveModel": (".local.naive", ()),
+    "ThetaModel": (".local.statsforecast", _STATSFORECAST_DEPENDENCIES),
+    "ZeroModel": (".local.statsforecast", ()),
+}
+
+# Note that `from autogluon.timeseries.models import *` resolves every name in __all__ and therefore imports all
+# models. Prefer explicit imports to keep the import time low.
+__all__ = sorted(_LAZY)
+
+
+def __getattr__(name: str):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    submodule_name, dependencies = _LAZY[name]
+    missing_dependencies = [d for d in dependencies if importlib.util.find_spec(d) is None]
+    if missing_dependencies:
+        raise ImportError(
+            f"{name} requires the following packages that are not installed: {missing_dependencies}. "
+            f"Please install them with `pip install autogluon.timeseries` to use {name}."
+        )
+    submodule = importlib.import_module(submodule_name, __name__)
+    value = getattr(submodule, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
+
+def preload(names: Optional[Iterable[str]] = None) -> None:
+    """Eagerly import model classes that are otherwise loaded lazily on first access.
+
+    Calling this function during startup (e.g., before a server starts accepting requests) moves the cost of importing
+    heavy dependencies out of the first call to ``fit`` or ``predict``.
+
+    Parameters
+    ----------
+    names : Iterable[str], optional
+        Names of the model classes to import, e.g. ``["ChronosModel", "DeepARModel"]``. If None, all models listed
+        in ``__all__`` are imported.
+    """
+    module = sys.modules[__name__]
+    for name in __all__ if names is None else names:
+        getattr(module, name)
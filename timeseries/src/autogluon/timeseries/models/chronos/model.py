@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 import logging
 import os
 from typing import Any, Dict, Literal, Optional, Union
@@ -94,11 +96,18 @@ class ChronosModel(AbstractTimeSeriesModel):
     optimization_strategy : {None, "onnx", "openvino"}, default = None
         Optimization strategy to use for inference on CPUs. If None, the model will use the default implementation.
         If `onnx`, the model will be converted to ONNX and the inference will be performed using ONNX. If ``openvino``,
-        inference will be performed with the model compiled to OpenVINO.
-    torch_dtype : torch.dtype or {"auto", "bfloat16", "float32", "float64"}, default = "auto"
+        inference will be performed with the model compiled to OpenVINO. Since exporting the model is slow, the
+        exported model is cached on disk and reused by later calls, including calls in other processes. The cache is
+        stored in ``~/.cache/autogluon/timeseries`` (a different directory can be set with the environment variable
+        ``AUTOGLUON_TS_MODEL_CACHE_DIR``) and is never cleaned up automatically, so the directory can be deleted to
+        free disk space. Set the environment variable ``AUTOGLUON_TS_MODEL_CACHE=0`` to disable the cache.
+    torch_dtype : torch.dtype or {"auto", "bfloat16", "float32", "float64", "int8"}, default = "auto"
         Torch data type for model weights, provided to ``from_pretrained`` method of Hugging Face AutoModels. If
         original Chronos models are specified and the model size is ``small``, ``base``, or ``large``, the
-        ``torch_dtype`` will be set to ``bfloat16`` to enable inference on GPUs.
+        ``torch_dtype`` will be set to ``bfloat16`` to enable inference on GPUs. If ``int8``, the weights of the
+        linear layers are dynamically quantized to 8-bit integers after loading, which reduces memory usage and
+        speeds up inference on the CPU at the cost of a small loss in accuracy. ``int8`` is only available on the CPU
+        and cannot be combined with ``optimization_strategy``.
     data_loader_num_workers : int, default = 0
         Number of worker processes to be used in the data loader. See documentation on ``torch.utils.data.DataLoader``
         for more information.
@@ -230,7 +239,11 @@ class ChronosModel(AbstractTimeSeriesModel):
                 "`import torch; torch.cuda.is_available()` returns `True`."
             )
 
-        device = self.device or ("cuda" if gpu_available else "auto")
+        if self.torch_dtype == "int8":
+            # quantized models only support inference on the CPU
+            device = self.device or "cpu"
+        else:
+            device = self.device or ("cuda" if gpu_available else "auto")
 
         pipeline = OptimizedChronosPipeline.from_pretrained(
             self.model_path,
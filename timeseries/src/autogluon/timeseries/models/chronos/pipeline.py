@@ -4,14 +4,28 @@
 # Original Source: https://github.com/amazon-science/chronos-forecasting
 # Authors: Lorenzo Stella <stellalo@amazon.com>, Abdul Fatir Ansari <ansarnd@amazon.com>
 
+import functools
+import hashlib
+import importlib.metadata
+import json
 import logging
+import os
+import shutil
 import warnings
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Any, Dict, List, Literal, Optional, Tuple, Union
 
 import torch
 import torch.nn as nn
-from transformers import AutoConfig, AutoModelForCausalLM, AutoModelForSeq2SeqLM, GenerationConfig, PreTrainedModel
+from transformers import (
+    AutoConfig,
+    AutoModelForCausalLM,
+    AutoModelForSeq2SeqLM,
+    GenerationConfig,
+    PretrainedConfig,
+    PreTrainedModel,
+)
 
 from autogluon.timeseries.utils.warning_filters import set_loggers_level
 
@@ -468,6 +482,139 @@ class ChronosPipeline:
         )
 
 
+@functools.lru_cache(maxsize=1)
+def _load_pretrained_weights(model_type: str, *args, **kwargs) -> Tuple[PretrainedConfig, Dict[str, torch.Tensor]]:
+    """Read the config and the weights of the inner Hugging Face model of a Chronos pipeline to the CPU.
+
+    The most recently read weights are cached, so that repeated loads with identical arguments (e.g., when the same
+    model is used for multiple validation windows) do not read and deserialize the checkpoint again. Call
+    ``_load_pretrained_weights.cache_clear()`` to release them.
+    """
+    model_class = AutoModelForSeq2SeqLM if model_type == "seq2seq" else AutoModelForCausalLM
+    model = model_class.from_pretrained(*args, **{**kwargs, "device_map": "cpu"})
+    return model.config, model.state_dict()
+
+
+def _load_pretrained_model(model_type: str, *args, **kwargs) -> PreTrainedModel:
+    """Load the inner Hugging Face model of a Chronos pipeline.
+
+    A new module is built from the cached CPU weights on each call, so that the module (and its copy on the GPU, if
+    any) is released once the pipeline that owns it is discarded.
+    """
+    device_map = kwargs.pop("device_map", None)
+    config, state_dict = _load_pretrained_weights(model_type, *args, **kwargs)
+    model_class = AutoModelForSeq2SeqLM if model_type == "seq2seq" else AutoModelForCausalLM
+    return model_class.from_pretrained(
+        None,
+        config=config,
+        state_dict=state_dict,
+        device_map=device_map,
+        torch_dtype=kwargs.get("torch_dtype"),
+    )
+
+
+def _get_model_cache_root() -> Path:
+    """Root directory of the on-disk model cache, can be changed with the environment variable
+    ``AUTOGLUON_TS_MODEL_CACHE_DIR``.
+    """
+    default_root = Path.home() / ".cache" / "autogluon" / "timeseries"
+    return Path(os.environ.get("AUTOGLUON_TS_MODEL_CACHE_DIR", default_root))
+
+
+def _get_package_version(package_name: str) -> Optional[str]:
+    try:
+        return importlib.metadata.version(package_name)
+    except importlib.metadata.PackageNotFoundError:
+        return None
+
+
+def _get_model_fingerprint(
+    model_path: str, cache_dir: Optional[str] = None, revision: Optional[str] = None
+) -> Dict[str, Any]:
+    """Fingerprint of the files of a model, so that the cached export is invalidated if the model changes.
+
+    Models from the Hugging Face Hub are identified by the commit of the snapshot in the local Hugging Face cache. The
+    snapshot is refreshed by ``AutoConfig.from_pretrained`` before the export cache is looked up, so a new upstream
+    commit results in a new fingerprint.
+    """
+    fingerprint = {}
+    model_dir = Path(model_path)
+    if not model_dir.is_dir():
+        from huggingface_hub import try_to_load_from_cache
+
+        config_path = try_to_load_from_cache(
+            str(model_path),
+            "config.json",
+            cache_dir=None if cache_dir is None else str(cache_dir),
+            revision=revision,
+        )
+        if not isinstance(config_path, str):
+            return fingerprint
+        model_dir = Path(config_path).parent
+        fingerprint["commit"] = model_dir.name
+    for file_path in sorted(model_dir.iterdir()):
+        if not file_path.is_file():
+            continue
+        if file_path.name == "config.json":
+            fingerprint[file_path.name] = file_path.read_text()
+        else:
+            stat = file_path.stat()
+            fingerprint[file_path.name] = [stat.st_size, stat.st_mtime_ns]
+    return fingerprint
+
+
+def _get_exported_model_cache_dir(model_path: str, optimization_strategy: str, **kwargs) -> Optional[Path]:
+    """Directory where the model exported with the given optimization strategy is cached across processes.
+
+    Returns None if caching is disabled by setting the environment variable ``AUTOGLUON_TS_MODEL_CACHE=0``.
+    """
+    if os.environ.get("AUTOGLUON_TS_MODEL_CACHE", "1") == "0":
+        return None
+    import transformers
+
+    cache_key = {
+        "model_path": str(model_path),
+        "model_files": _get_model_fingerprint(
+            model_path, cache_dir=kwargs.get("cache_dir"), revision=kwargs.get("revision")
+        ),
+        "optimization_strategy": optimization_strategy,
+        "kwargs": kwargs,
+        "torch": torch.__version__,
+        "transformers": transformers.__version__,
+        "optimum": _get_package_version("optimum"),
+        "backend": _get_package_version("onnxruntime" if optimization_strategy == "onnx" else "openvino"),
+    }
+    cache_key_hash = hashlib.sha1(json.dumps(cache_key, sort_keys=True, default=str).encode()).hexdigest()
+    return _get_model_cache_root() / optimization_strategy / cache_key_hash
+
+
+def _load_exported_model(model_class: type, optimization_strategy: str, model_path: str, **kwargs):
+    """Load an optimum model exported to ONNX / OpenVINO.
+
+    Exporting the model is slow, so the exported model is saved to disk and reused by subsequent calls, including
+    calls in other processes.
+    """
+    cache_dir = _get_exported_model_cache_dir(model_path, optimization_strategy, **kwargs)
+    if cache_dir is not None and cache_dir.is_dir():
+        try:
+            return model_class.from_pretrained(cache_dir, **kwargs)
+        except Exception as e:
+            logger.debug(f"Could not load cached exported model from {cache_dir}, exporting it again ({e})")
+
+    model = model_class.from_pretrained(model_path, **{**kwargs, "export": True})
+    if cache_dir is not None:
+        # write to a temporary directory first so that other processes never read a partially saved model
+        tmp_dir = cache_dir.with_name(f"{cache_dir.name}.tmp{os.getpid()}")
+        try:
+            model.save_pretrained(tmp_dir)
+            shutil.rmtree(cache_dir, ignore_errors=True)
+            os.replace(tmp_dir, cache_dir)
+        except OSError as e:
+            logger.debug(f"Could not cache exported model to {cache_dir} ({e})")
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+    return model
+
+
 class OptimizedChronosPipeline(ChronosPipeline):
     """A wrapper around the ChronosPipeline object for CPU-optimized model classes from
     HuggingFace optimum.
@@ -499,12 +646,25 @@ class OptimizedChronosPipeline(ChronosPipeline):
         chronos_config = ChronosConfig(**config.chronos_config)
 
         torch_dtype = kwargs.get("torch_dtype", "auto")
-        if torch_dtype != "auto" and isinstance(torch_dtype, str):
+        quantize_to_int8 = torch_dtype == "int8"
+        if quantize_to_int8:
+            if optimization_strategy is not None:
+                raise ValueError(
+                    f"torch_dtype 'int8' cannot be combined with optimization_strategy {optimization_strategy}"
+                )
+            if kwargs.get("device_map", "cpu") not in ["cpu", "auto"]:
+                raise ValueError(
+                    f"torch_dtype 'int8' is only available on the CPU, but device {kwargs['device_map']} was provided"
+                )
+            # weights are loaded in float32 and the linear layers are quantized dynamically after loading
+            kwargs["device_map"] = "cpu"
+            kwargs["torch_dtype"] = torch.float32
+        elif torch_dtype != "auto" and isinstance(torch_dtype, str):
             kwargs["torch_dtype"] = cls.dtypes[torch_dtype]
 
         if chronos_config.model_type == "seq2seq":
             if optimization_strategy is None:
-                inner_model = AutoModelForSeq2SeqLM.from_pretrained(*args, **kwargs)
+                inner_model = _load_pretrained_model(chronos_config.model_type, *args, **kwargs)
             else:
                 assert optimization_strategy in [
                     "onnx",
@@ -526,7 +686,9 @@ class OptimizedChronosPipeline(ChronosPipeline):
 
                     assert kwargs.pop("device_map", "cpu") in ["cpu", "auto"], "ONNX mode only available on the CPU"
                     with set_loggers_level(regex=r"^optimum.*", level=logging.ERROR):
-                        inner_model = ORTModelForSeq2SeqLM.from_pretrained(*args, **{**kwargs, "export": True})
+                        inner_model = _load_exported_model(
+                            ORTModelForSeq2SeqLM, optimization_strategy, *args, **kwargs
+                        )
                 elif optimization_strategy == "openvino":
                     try:
                         from optimum.intel import OVModelForSeq2SeqLM
@@ -535,12 +697,16 @@ class OptimizedChronosPipeline(ChronosPipeline):
                             "Huggingface Optimum library must be installed with OpenVINO for using the `openvino` strategy"
                         )
                     with set_loggers_level(regex=r"^optimum.*", level=logging.ERROR):
-                        inner_model = OVModelForSeq2SeqLM.from_pretrained(
-                            *args, **{**kwargs, "device_map": "cpu", "export": True}
+                        inner_model = _load_exported_model(
+                            OVModelForSeq2SeqLM, optimization_strategy, *args, **{**kwargs, "device_map": "cpu"}
                         )
         else:
             assert config.model_type == "causal"
-            inner_model = AutoModelForCausalLM.from_pretrained(*args, **kwargs)
+            inner_model = _load_pretrained_model(chronos_config.model_type, *args, **kwargs)
+
+        if quantize_to_int8:
+            # returns a quantized copy, so the cached float32 weights remain unchanged
+            inner_model = torch.ao.quantization.quantize_dynamic(inner_model, {nn.Linear}, dtype=torch.qint8)
 
         return cls(
             tokenizer=chronos_config.create_tokenizer(),
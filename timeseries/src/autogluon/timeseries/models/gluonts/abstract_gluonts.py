@@ -1,9 +1,11 @@
+from __future__ import annotations
+
 import logging
 import os
 import shutil
 from datetime import timedelta
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterator, List, Literal, Optional, Type, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Literal, Optional, Type, Union
 
 import gluonts
 import gluonts.core.settings
@@ -12,9 +14,7 @@ import pandas as pd
 from gluonts.core.component import from_hyperparameters
 from gluonts.dataset.common import Dataset as GluonTSDataset
 from gluonts.dataset.field_names import FieldName
-from gluonts.model.estimator import Estimator as GluonTSEstimator
-from gluonts.model.forecast import Forecast, QuantileForecast, SampleForecast
-from gluonts.model.predictor import Predictor as GluonTSPredictor
+from gluonts.model.forecast import QuantileForecast, SampleForecast
 from sklearn.compose import ColumnTransformer
 from sklearn.preprocessing import QuantileTransformer, StandardScaler
 
@@ -29,6 +29,11 @@ from autogluon.timeseries.utils.datetime import norm_freq_str
 from autogluon.timeseries.utils.forecast import get_forecast_horizon_index_ts_dataframe
 from autogluon.timeseries.utils.warning_filters import disable_root_logger, warning_filter
 
+if TYPE_CHECKING:
+    from gluonts.model.estimator import Estimator as GluonTSEstimator
+    from gluonts.model.forecast import Forecast
+    from gluonts.model.predictor import Predictor as GluonTSPredictor
+
 # NOTE: We avoid imports for torch and lightning.pytorch at the top level and hide them inside class methods.
 # This is done to skip these imports during multiprocessing (which may cause bugs)
 
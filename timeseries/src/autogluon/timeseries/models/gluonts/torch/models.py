@@ -2,10 +2,10 @@
 Module including wrappers for PyTorch implementations of models in GluonTS
 """
 
-import logging
-from typing import Any, Dict, Type
+from __future__ import annotations
 
-from gluonts.model.estimator import Estimator as GluonTSEstimator
+import logging
+from typing import TYPE_CHECKING, Any, Dict, Type
 
 from autogluon.timeseries.models.gluonts.abstract_gluonts import AbstractGluonTSModel
 from autogluon.timeseries.utils.datetime import (
@@ -14,6 +14,9 @@ from autogluon.timeseries.utils.datetime import (
     get_time_features_for_frequency,
 )
 
+if TYPE_CHECKING:
+    from gluonts.model.estimator import Estimator as GluonTSEstimator
+
 # NOTE: We avoid imports for torch and lightning.pytorch at the top level and hide them inside class methods.
 # This is done to skip these imports during multiprocessing (which may cause bugs)
 
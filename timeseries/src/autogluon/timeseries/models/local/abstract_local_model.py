@@ -1,8 +1,11 @@
+from __future__ import annotations
+
 import logging
 import time
 from multiprocessing import TimeoutError, cpu_count
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
+import joblib.externals.loky
 import numpy as np
 import pandas as pd
 from joblib import Parallel, delayed
@@ -21,6 +24,12 @@ logger = logging.getLogger(__name__)
 # We use the same default n_jobs across AG-TS to ensure that Joblib reuses the process pool
 AG_DEFAULT_N_JOBS = max(int(cpu_count() * 0.5), 1)
 
+# By default, joblib w/ loky backend kills processes that take >300MB of RAM assuming that this is caused by a
+# memory leak. This leads to problems for some memory-hungry models like AutoARIMA/Theta.
+# This monkey patch removes this undesired behavior. The patch runs at import time, so that it is also applied inside
+# the worker processes, which import this module when unpickling the model.
+joblib.externals.loky.process_executor._MAX_MEMORY_LEAK_SIZE = int(3e10)
+
 
 class AbstractLocalModel(AbstractTimeSeriesModel):
     """Abstract class for local forecasting models that are trained separately for each time series.
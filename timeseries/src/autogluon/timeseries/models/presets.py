@@ -1,4 +1,5 @@
 import copy
+import importlib
 import logging
 import re
 from collections import defaultdict
@@ -8,34 +9,6 @@ from autogluon.common import space
 from autogluon.core import constants
 from autogluon.timeseries.metrics import TimeSeriesScorer
 
-from . import (
-    ADIDAModel,
-    ARIMAModel,
-    AutoARIMAModel,
-    AutoCESModel,
-    AutoETSModel,
-    AverageModel,
-    ChronosModel,
-    CrostonSBAModel,
-    DeepARModel,
-    DirectTabularModel,
-    DLinearModel,
-    DynamicOptimizedThetaModel,
-    ETSModel,
-    IMAPAModel,
-    NaiveModel,
-    NPTSModel,
-    PatchTSTModel,
-    RecursiveTabularModel,
-    SeasonalAverageModel,
-    SeasonalNaiveModel,
-    SimpleFeedForwardModel,
-    TemporalFusionTransformerModel,
-    ThetaModel,
-    TiDEModel,
-    WaveNetModel,
-    ZeroModel,
-)
 from .abstract import AbstractTimeSeriesModel
 from .multi_window.multi_window_model import MultiWindowBacktestingModel
 
@@ -43,37 +16,56 @@ logger = logging.getLogger(__name__)
 
 ModelHyperparameters = Dict[str, Any]
 
-# define the model zoo with their aliases
+
+# define the model zoo with their aliases. Models are given by the names of the classes in autogluon.timeseries.models,
+# which are only imported once the model is used
 MODEL_TYPES = dict(
-    SimpleFeedForward=SimpleFeedForwardModel,
-    DeepAR=DeepARModel,
-    DLinear=DLinearModel,
-    PatchTST=PatchTSTModel,
-    TemporalFusionTransformer=TemporalFusionTransformerModel,
-    TiDE=TiDEModel,
-    WaveNet=WaveNetModel,
-    RecursiveTabular=RecursiveTabularModel,
-    DirectTabular=DirectTabularModel,
-    Average=AverageModel,
-    SeasonalAverage=SeasonalAverageModel,
-    Naive=NaiveModel,
-    SeasonalNaive=SeasonalNaiveModel,
-    Zero=ZeroModel,
-    AutoETS=AutoETSModel,
-    AutoCES=AutoCESModel,
-    AutoARIMA=AutoARIMAModel,
-    DynamicOptimizedTheta=DynamicOptimizedThetaModel,
-    NPTS=NPTSModel,
-    Theta=ThetaModel,
-    ETS=ETSModel,
-    ARIMA=ARIMAModel,
-    ADIDA=ADIDAModel,
-    CrostonSBA=CrostonSBAModel,
-    IMAPA=IMAPAModel,
-    Chronos=ChronosModel,
+    SimpleFeedForward="SimpleFeedForwardModel",
+    DeepAR="DeepARModel",
+    DLinear="DLinearModel",
+    PatchTST="PatchTSTModel",
+    TemporalFusionTransformer="TemporalFusionTransformerModel",
+    TiDE="TiDEModel",
+    WaveNet="WaveNetModel",
+    RecursiveTabular="RecursiveTabularModel",
+    DirectTabular="DirectTabularModel",
+    Average="AverageModel",
+    SeasonalAverage="SeasonalAverageModel",
+    Naive="NaiveModel",
+    SeasonalNaive="SeasonalNaiveModel",
+    Zero="ZeroModel",
+    AutoETS="AutoETSModel",
+    AutoCES="AutoCESModel",
+    AutoARIMA="AutoARIMAModel",
+    DynamicOptimizedTheta="DynamicOptimizedThetaModel",
+    NPTS="NPTSModel",
+    Theta="ThetaModel",
+    ETS="ETSModel",
+    ARIMA="ARIMAModel",
+    ADIDA="ADIDAModel",
+    CrostonSBA="CrostonSBAModel",
+    IMAPA="IMAPAModel",
+    Chronos="ChronosModel",
 )
 
-DEFAULT_MODEL_NAMES = {v: k for k, v in MODEL_TYPES.items()}
+
+def get_model_class(name: str) -> Type[AbstractTimeSeriesModel]:
+    """Model class registered in ``MODEL_TYPES`` under the given alias."""
+    model_type = MODEL_TYPES[name]
+    if isinstance(model_type, str):
+        model_type = getattr(importlib.import_module(__package__), model_type)
+    return model_type
+
+
+def __getattr__(name):
+    # Mapping from model classes to aliases, built on first access since it requires importing all model classes
+    if name == "DEFAULT_MODEL_NAMES":
+        default_model_names = {get_model_class(k): k for k in MODEL_TYPES}
+        globals()[name] = default_model_names
+        return default_model_names
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 DEFAULT_MODEL_PRIORITY = dict(
     Naive=100,
     SeasonalNaive=100,
@@ -219,7 +211,7 @@ def get_preset_models(
             if "mxnet" in model.lower():
                 logger.info(f"\tMXNet model '{model}' given in `hyperparameters` is deprecated and won't be trained. ")
                 continue
-            model_type = MODEL_TYPES[model]
+            model_type = get_model_class(model)
         elif isinstance(model, type):
             if not issubclass(model, AbstractTimeSeriesModel):
                 raise ValueError(f"Custom model type {model} must inherit from `AbstractTimeSeriesModel`.")
@@ -1,3 +1,8 @@
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
 from uuid import uuid4
 
 import pytest
@@ -9,6 +14,7 @@ def pytest_addoption(parser):
 
 def pytest_configure(config):
     config.addinivalue_line("markers", "slow: mark test as slow to run")
+    config.addinivalue_line("markers", "enable_logging: keep logging enabled in tests that check the log output")
 
     # known gluonts warnings
     config.addinivalue_line("filterwarnings", "ignore:Using `json`-module:UserWarning")
@@ -16,6 +22,14 @@ def pytest_configure(config):
     # pandas future warnings on timestamp freq being deprecated
     config.addinivalue_line("filterwarnings", "ignore:.+freq:FutureWarning")
 
+    # render plots with the non-interactive Agg backend, so that plotting tests don't initialize a GUI toolkit
+    os.environ.setdefault("MPLBACKEND", "Agg")
+
+    # when tests are distributed over multiple processes with pytest-xdist, restrict each worker to a single thread
+    # to avoid oversubscribing the CPU. torch reads OMP_NUM_THREADS when it is first imported by the tests.
+    if os.environ.get("PYTEST_XDIST_WORKER") is not None:
+        os.environ.setdefault("OMP_NUM_THREADS", "1")
+
 
 def pytest_collection_modifyitems(config, items):
     if config.getoption("--runslow"):
@@ -27,10 +41,53 @@ def pytest_collection_modifyitems(config, items):
             item.add_marker(skip_slow)
 
 
+# /dev/shm is only used if it has enough free space for the models saved during the tests (e.g., Docker limits it
+# to 64MB by default)
+MIN_FREE_SHM_BYTES = 2 * 1024**3
+
+
+@pytest.fixture(scope="session")
+def shm_tmp_dir(request):
+    """RAM-backed directory under /dev/shm that is removed at the end of the session, or None if unavailable.
+
+    /dev/shm is not used if a custom ``--basetemp`` is passed to pytest.
+    """
+    shm_path = Path("/dev/shm")
+    if (
+        sys.platform.startswith("linux")
+        and request.config.option.basetemp is None
+        and shm_path.is_dir()
+        and shutil.disk_usage(shm_path).free >= MIN_FREE_SHM_BYTES
+    ):
+        path = tempfile.mkdtemp(prefix="ag_ts_tests_", dir=shm_path)
+        yield Path(path)
+        shutil.rmtree(path, ignore_errors=True)
+    else:
+        yield None
+
+
+@pytest.fixture(scope="session", autouse=True)
+def model_cache_dir(tmp_path_factory):
+    """Write models cached on disk (e.g., exported Chronos models) to a temporary directory instead of ~/.cache."""
+    cache_dir = tmp_path_factory.mktemp("model_cache")
+    previous_value = os.environ.get("AUTOGLUON_TS_MODEL_CACHE_DIR")
+    os.environ["AUTOGLUON_TS_MODEL_CACHE_DIR"] = str(cache_dir)
+    yield cache_dir
+    if previous_value is None:
+        os.environ.pop("AUTOGLUON_TS_MODEL_CACHE_DIR", None)
+    else:
+        os.environ["AUTOGLUON_TS_MODEL_CACHE_DIR"] = previous_value
+
+
 @pytest.fixture()
-def temp_model_path(tmp_path_factory):
-    fn = tmp_path_factory.mktemp(str(uuid4())[:6])
-    return str(fn)
+def temp_model_path(tmp_path_factory, shm_tmp_dir):
+    # free space is checked for each test, since tests running in parallel share /dev/shm
+    if shm_tmp_dir is not None and shutil.disk_usage(shm_tmp_dir).free >= MIN_FREE_SHM_BYTES:
+        path = tempfile.mkdtemp(prefix=str(uuid4())[:6], dir=shm_tmp_dir)
+    else:
+        path = str(tmp_path_factory.mktemp(str(uuid4())[:6]))
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
 
 
 @pytest.fixture(scope="session")
@@ -50,7 +107,7 @@ def hf_model_path(tmp_path_factory):
         _ = ChronosPipeline.from_pretrained(model_hub_id, cache_dir=str(cache_path))
 
         # get model snapshot path
-        snapshots_path = cache_path / "models--amazon--chronos-t5-tiny" / "snapshots"
+        snapshots_path = cache_path / f"models--{model_hub_id.replace('/', '--')}" / "snapshots"
         assert snapshots_path.exists()
         snapshot_dir = next(snapshots_path.iterdir())
         assert snapshot_dir.is_dir()
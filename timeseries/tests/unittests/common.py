@@ -1,7 +1,8 @@
 """Common utils and data for all model tests"""
 
+import functools
 import random
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -9,6 +10,7 @@ from packaging.version import Version
 
 from autogluon.timeseries.dataset.ts_dataframe import ITEMID, TIMESTAMP, TimeSeriesDataFrame
 from autogluon.timeseries.metrics import TimeSeriesScorer
+from autogluon.timeseries.models.abstract import AbstractTimeSeriesModel
 from autogluon.timeseries.utils.forecast import get_forecast_horizon_index_ts_dataframe
 
 # TODO: add larger unit test data sets to S3
@@ -143,20 +145,30 @@ def mask_entries(data: TimeSeriesDataFrame) -> TimeSeriesDataFrame:
     return data
 
 
+# DUMMY_TS_DATAFRAME (4 items x 20 time steps) is close to the minimal size required by the tests that use it:
+# mask_entries needs at least 60 rows, and tests fit with up to num_val_windows=7, which requires at least
+# _min_train_length + prediction_length + (num_val_windows - 1) * val_step_size = 5 + 1 + 6 = 12 time steps per item.
 DUMMY_TS_DATAFRAME = mask_entries(get_data_frame_with_item_index(["10", "A", "2", "1"]))
 
 
+@functools.lru_cache(maxsize=64)
+def _get_index_with_variable_lengths(item_id_length_pairs: Tuple[Tuple[str, int], ...], freq: str) -> pd.MultiIndex:
+    # pd.MultiIndex is immutable, so the cached index can be safely shared between data frames
+    tuples = []
+    for item_id, length in item_id_length_pairs:
+        for ts in pd.date_range(pd.Timestamp("2022-01-01"), periods=length, freq=freq):
+            tuples.append((item_id, ts))
+    return pd.MultiIndex.from_tuples(tuples, names=[ITEMID, TIMESTAMP])
+
+
 def get_data_frame_with_variable_lengths(
     item_id_to_length: Dict[str, int],
     static_features: Optional[pd.DataFrame] = None,
     covariates_names: Optional[List[str]] = None,
     freq: str = "D",
 ):
-    tuples = []
-    for item_id, length in item_id_to_length.items():
-        for ts in pd.date_range(pd.Timestamp("2022-01-01"), periods=length, freq=freq):
-            tuples.append((item_id, ts))
-    index = pd.MultiIndex.from_tuples(tuples, names=[ITEMID, TIMESTAMP])
+    # Item order is preserved in the cache key since some tests rely on items not being sorted
+    index = _get_index_with_variable_lengths(tuple(item_id_to_length.items()), freq)
     df = TimeSeriesDataFrame(
         pd.DataFrame(
             index=index,
@@ -241,3 +253,30 @@ def get_prediction_for_df(data, prediction_length=5):
 
 
 PREDICTIONS_FOR_DUMMY_TS_DATAFRAME = get_prediction_for_df(DUMMY_TS_DATAFRAME)
+
+
+class DummyModel(AbstractTimeSeriesModel):
+    """Model that does no training and returns random forecasts.
+
+    Used in predictor and trainer tests that only check the control flow, so that they don't spend time on
+    fitting deep learning models.
+    """
+
+    def _fit(self, train_data: TimeSeriesDataFrame, val_data: Optional[TimeSeriesDataFrame] = None, **kwargs) -> None:
+        pass
+
+    def _predict(
+        self, data: TimeSeriesDataFrame, known_covariates: Optional[TimeSeriesDataFrame] = None, **kwargs
+    ) -> TimeSeriesDataFrame:
+        forecast_index = get_forecast_horizon_index_ts_dataframe(data, prediction_length=self.prediction_length)
+        columns = ["mean"] + [str(q) for q in self.quantile_levels]
+        values = np.random.normal(size=[len(forecast_index), len(columns)])
+        return TimeSeriesDataFrame(pd.DataFrame(values, index=forecast_index, columns=columns))
+
+
+class DummyDeepARModel(DummyModel):
+    """DummyModel trained in place of DeepAR, named DummyDeepAR in the leaderboard."""
+
+
+class DummySimpleFeedForwardModel(DummyModel):
+    """DummyModel trained in place of SimpleFeedForward, named DummySimpleFeedForward in the leaderboard."""
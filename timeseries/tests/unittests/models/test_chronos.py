@@ -1,4 +1,7 @@
+import shutil
+from pathlib import Path
 from typing import Optional
+from unittest import mock
 
 import numpy as np
 import pytest
@@ -7,6 +10,11 @@ import torch
 from autogluon.core.utils.exceptions import TimeLimitExceeded
 from autogluon.timeseries import TimeSeriesPredictor
 from autogluon.timeseries.models import ChronosModel
+from autogluon.timeseries.models.chronos.pipeline import (
+    _get_exported_model_cache_dir,
+    _load_exported_model,
+    _load_pretrained_weights,
+)
 from autogluon.timeseries.models.chronos.utils import (
     ChronosInferenceDataLoader,
     ChronosInferenceDataset,
@@ -310,6 +318,37 @@ def test_when_torch_dtype_provided_and_model_persisted_then_parameters_loaded_in
     assert embedding_matrix.dtype is expected_dtype
 
 
+def test_when_torch_dtype_is_int8_then_linear_layers_are_quantized_and_model_can_infer(hf_model_path):
+    model = ChronosModel(
+        hyperparameters={
+            "model_path": hf_model_path,
+            "device": "cpu",
+            "torch_dtype": "int8",
+        },
+    )
+    model.persist()
+
+    modules = list(model.model_pipeline.model.model.modules())
+    assert any(isinstance(m, torch.ao.nn.quantized.dynamic.Linear) for m in modules)
+    assert not any(type(m) is torch.nn.Linear for m in modules)
+    assert model.model_pipeline.predict(torch.tensor([[1, 2, 3]])) is not None
+
+
+@pytest.mark.parametrize(
+    "hyperparameters, match",
+    [
+        ({"optimization_strategy": "onnx"}, "cannot be combined with optimization_strategy"),
+        ({"device": "cuda"}, "only available on the CPU"),
+    ],
+)
+def test_when_torch_dtype_is_int8_and_quantization_not_supported_then_value_error_is_raised(
+    hf_model_path, hyperparameters, match
+):
+    model = ChronosModel(hyperparameters={"model_path": hf_model_path, "torch_dtype": "int8", **hyperparameters})
+    with pytest.raises(ValueError, match=match):
+        model.persist()
+
+
 def test_when_model_persisted_then_model_pipeline_can_infer(hf_model_path):
     model = ChronosModel(
         hyperparameters={
@@ -321,6 +360,74 @@ def test_when_model_persisted_then_model_pipeline_can_infer(hf_model_path):
     assert model.model_pipeline.predict(torch.tensor([[1, 2, 3]])) is not None
 
 
+def test_when_model_pipeline_loaded_twice_then_pretrained_weights_are_read_once_into_separate_modules(hf_model_path):
+    _load_pretrained_weights.cache_clear()
+    models = [ChronosModel(hyperparameters={"model_path": hf_model_path, "device": "cpu"}) for _ in range(2)]
+    for model in models:
+        model.persist()
+    assert models[0].model_pipeline.model.model is not models[1].model_pipeline.model.model
+    assert _load_pretrained_weights.cache_info().misses == 1
+
+
+class ExportedModelStub:
+    """Records the calls to ``from_pretrained`` instead of exporting the model with optimum."""
+
+    def __init__(self, calls):
+        self.calls = calls
+
+    def from_pretrained(self, path, **kwargs):
+        self.calls.append((str(path), kwargs.get("export", False)))
+        return self
+
+    def save_pretrained(self, path):
+        Path(path).mkdir(parents=True)
+        (Path(path) / "model.onnx").touch()
+
+
+def test_when_exported_model_loaded_twice_then_second_load_reads_model_from_cache(
+    hf_model_path, tmp_path, monkeypatch
+):
+    monkeypatch.setenv("AUTOGLUON_TS_MODEL_CACHE_DIR", str(tmp_path))
+    calls = []
+    for _ in range(2):
+        _load_exported_model(ExportedModelStub(calls), "onnx", hf_model_path)
+    cache_dir = _get_exported_model_cache_dir(hf_model_path, "onnx")
+    assert cache_dir.parent.parent == tmp_path
+    assert calls == [(hf_model_path, True), (str(cache_dir), False)]
+
+
+def test_when_model_cache_disabled_then_model_is_exported_on_each_load(hf_model_path, tmp_path, monkeypatch):
+    monkeypatch.setenv("AUTOGLUON_TS_MODEL_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("AUTOGLUON_TS_MODEL_CACHE", "0")
+    calls = []
+    for _ in range(2):
+        _load_exported_model(ExportedModelStub(calls), "onnx", hf_model_path)
+    assert calls == [(hf_model_path, True), (hf_model_path, True)]
+    assert not any(tmp_path.iterdir())
+
+
+def test_when_model_files_or_load_arguments_change_then_exported_model_cache_dir_changes(hf_model_path, tmp_path):
+    model_path = shutil.copytree(hf_model_path, tmp_path / "model")
+    cache_dir = _get_exported_model_cache_dir(model_path, "onnx")
+    assert _get_exported_model_cache_dir(model_path, "onnx") == cache_dir
+    assert _get_exported_model_cache_dir(model_path, "onnx", revision="main") != cache_dir
+
+    with open(model_path / "config.json", "a") as f:
+        f.write("\n")
+    assert _get_exported_model_cache_dir(model_path, "onnx") != cache_dir
+
+
+def test_when_hub_model_snapshot_changes_then_exported_model_cache_dir_changes(tmp_path):
+    cache_dirs = []
+    for commit in ["commit_a", "commit_b"]:
+        snapshot_dir = tmp_path / "snapshots" / commit
+        snapshot_dir.mkdir(parents=True)
+        (snapshot_dir / "config.json").write_text("{}")
+        with mock.patch("huggingface_hub.try_to_load_from_cache", return_value=str(snapshot_dir / "config.json")):
+            cache_dirs.append(_get_exported_model_cache_dir("autogluon/chronos-t5-tiny", "onnx"))
+    assert cache_dirs[0] != cache_dirs[1]
+
+
 def test_when_model_not_persisted_only_fit_then_model_pipeline_is_none(hf_model_path):
     model = ChronosModel(
         hyperparameters={
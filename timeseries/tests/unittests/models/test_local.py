@@ -4,6 +4,8 @@ from typing import Dict
 import numpy as np
 import pandas as pd
 import pytest
+from joblib import Parallel, delayed
+from joblib.externals.loky import process_executor
 
 from autogluon.timeseries import TimeSeriesDataFrame
 from autogluon.timeseries.models.local import (
@@ -410,3 +412,12 @@ def test_when_local_models_fit_then_quantiles_are_present_and_ranked(model_class
 
     assert set(model.quantile_levels) == set(float(q) for q in quantile_columns)
     assert np.diff(predictions[quantile_columns].values, axis=1).min() >= 0
+
+
+def test_when_local_model_is_used_in_worker_process_then_memory_leak_limit_is_increased():
+    # unpickling the model imports the module of the model in the worker process
+    model = NaiveModel()
+    leak_limits = Parallel(n_jobs=2)(
+        delayed(lambda _: process_executor._MAX_MEMORY_LEAK_SIZE)(model) for _ in range(2)
+    )
+    assert leak_limits == [int(3e10)] * 2
@@ -1,7 +1,10 @@
 """Unit tests and utils common to all models"""
 
+import ast
+import importlib
 import itertools
 import shutil
+import subprocess
 import sys
 import tempfile
 from unittest import mock
@@ -13,12 +16,13 @@ from flaky import flaky
 
 from autogluon.common import space
 from autogluon.core.hpo.constants import RAY_BACKEND
-from autogluon.timeseries import TimeSeriesDataFrame
+from autogluon.timeseries import TimeSeriesDataFrame, models
 from autogluon.timeseries.dataset.ts_dataframe import ITEMID, TIMESTAMP
 from autogluon.timeseries.metrics import AVAILABLE_METRICS
 from autogluon.timeseries.models import DeepARModel, ETSModel
 from autogluon.timeseries.models.abstract import AbstractTimeSeriesModel
 from autogluon.timeseries.models.multi_window import MultiWindowBacktestingModel
+from autogluon.timeseries.models.presets import DEFAULT_MODEL_NAMES, MODEL_TYPES, get_model_class
 
 from ..common import (
     DUMMY_TS_DATAFRAME,
@@ -616,3 +620,134 @@ def test_given_context_has_1_observation_when_model_predicts_then_model_can_pred
     )
     predictions = model.predict(data)
     assert len(predictions) == data.num_items * prediction_length
+
+
+@pytest.mark.parametrize("model_name", models.__all__)
+def test_when_model_accessed_from_models_module_then_model_class_is_resolved(model_name):
+    model_class = getattr(models, model_name)
+    assert issubclass(model_class, AbstractTimeSeriesModel)
+    assert model_name in dir(models)
+
+
+@pytest.mark.parametrize("alias", MODEL_TYPES)
+def test_when_model_class_resolved_from_alias_then_model_class_is_returned(alias):
+    model_class = get_model_class(alias)
+    assert issubclass(model_class, AbstractTimeSeriesModel)
+    assert DEFAULT_MODEL_NAMES[model_class] == alias
+
+
+def test_when_unknown_attribute_accessed_from_models_module_then_attribute_error_is_raised():
+    with pytest.raises(AttributeError, match="has no attribute 'UnknownModel'"):
+        getattr(models, "UnknownModel")
+
+
+def test_when_model_accessed_from_models_module_then_model_class_is_cached_in_module_globals():
+    model_class = getattr(models, "NaiveModel")
+    assert models.__dict__["NaiveModel"] is model_class
+
+
+def test_when_lightweight_model_imported_then_deep_learning_dependencies_are_not_imported():
+    code = (
+        "import sys\n"
+        "from autogluon.timeseries.models import NaiveModel\n"
+        "from autogluon.timeseries.models.presets import get_preset_models\n"
+        "heavy = ['gluonts', 'transformers', 'autogluon.timeseries.models.chronos']\n"
+        "print([name for name in heavy if name in sys.modules])\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip().splitlines()[-1] == "[]"
+
+
+def test_when_preload_called_with_names_then_models_are_cached_in_module_globals():
+    models.preload(["SeasonalNaiveModel", "ETSModel"])
+    assert "SeasonalNaiveModel" in models.__dict__
+    assert "ETSModel" in models.__dict__
+
+
+def test_when_preload_called_with_empty_list_then_no_models_are_imported():
+    # preloading the names in __all__ would raise an AttributeError
+    with mock.patch.object(models, "__all__", ["UnknownModel"]):
+        models.preload([])
+
+
+def test_when_model_dependency_is_missing_then_lazy_import_raises_informative_error():
+    with mock.patch("importlib.util.find_spec", return_value=None):
+        with pytest.raises(ImportError, match="ChronosModel requires the following packages"):
+            models.__getattr__("ChronosModel")
+
+
+@pytest.mark.parametrize("package_name", [".autogluon_tabular", ".chronos", ".gluonts", ".local"])
+def test_when_backend_package_exports_models_then_lazy_table_matches_exports(package_name):
+    package = importlib.import_module(package_name, models.__name__)
+    exported_models = {
+        name
+        for name, value in vars(package).items()
+        if isinstance(value, type) and issubclass(value, AbstractTimeSeriesModel)
+    }
+    lazy_models = {
+        name for name, (submodule_name, _) in models._LAZY.items() if submodule_name.startswith(package_name)
+    }
+    assert exported_models == lazy_models
+    for name in lazy_models:
+        submodule_name, _ = models._LAZY[name]
+        assert getattr(models, name).__module__.startswith(models.__name__ + submodule_name)
+
+
+OPTIONAL_DEPENDENCIES = {"gluonts", "lightning", "mlforecast", "statsforecast", "torch", "transformers"}
+
+
+def _get_imported_packages(nodes, package, visited_modules):
+    """Top-level packages imported by the given AST nodes, following imports of other autogluon.timeseries modules."""
+    packages = set()
+    for node in nodes:
+        for child in ast.walk(node):
+            if isinstance(child, ast.Import):
+                module_names = [alias.name for alias in child.names]
+            elif isinstance(child, ast.ImportFrom):
+                module_name = importlib.util.resolve_name("." * child.level + (child.module or ""), package)
+                module_names = [module_name] + [f"{module_name}.{alias.name}" for alias in child.names]
+            else:
+                continue
+            for module_name in module_names:
+                if module_name.startswith("autogluon.timeseries."):
+                    packages |= _get_packages_imported_by_module(module_name, visited_modules)
+                elif not module_name.startswith("autogluon."):
+                    packages.add(module_name.split(".")[0])
+    return packages
+
+
+def _get_packages_imported_by_module(module_name, visited_modules):
+    """Top-level packages imported when the module is imported, ignoring imports inside functions and classes."""
+    if module_name in visited_modules:
+        return set()
+    visited_modules.add(module_name)
+    try:
+        spec = importlib.util.find_spec(module_name)
+    except ModuleNotFoundError:
+        # name imported from a module, e.g. a class
+        return set()
+    if spec is None or spec.origin is None or not spec.origin.endswith(".py"):
+        return set()
+    with open(spec.origin) as f:
+        tree = ast.parse(f.read())
+    package = module_name if spec.submodule_search_locations is not None else module_name.rpartition(".")[0]
+    top_level_imports = [node for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))]
+    return _get_imported_packages(top_level_imports, package, visited_modules)
+
+
+@pytest.mark.parametrize("model_name", sorted(models._LAZY))
+def test_when_model_is_imported_and_used_then_only_declared_optional_dependencies_are_imported(model_name):
+    visited_modules = set()
+    imported_packages = set()
+    for cls in getattr(models, model_name).__mro__:
+        if not cls.__module__.startswith("autogluon.timeseries.models"):
+            continue
+        module = sys.modules[cls.__module__]
+        with open(module.__file__) as f:
+            tree = ast.parse(f.read())
+        class_nodes = [node for node in tree.body if isinstance(node, ast.ClassDef) and node.name == cls.__name__]
+        imported_packages |= _get_imported_packages(class_nodes, module.__package__, visited_modules)
+        imported_packages |= _get_packages_imported_by_module(cls.__module__, visited_modules)
+    _, dependencies = models._LAZY[model_name]
+    assert imported_packages & OPTIONAL_DEPENDENCIES == set(dependencies)
+
@@ -1,14 +1,14 @@
 """Unit tests for predictors"""
 
-import copy
+import gc
 import logging
 import math
+import shutil
 import sys
 from pathlib import Path
 from unittest import mock
 from uuid import uuid4
 
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 import pytest
@@ -20,6 +20,7 @@ from autogluon.timeseries.dataset.ts_dataframe import ITEMID, TIMESTAMP
 from autogluon.timeseries.metrics import DEFAULT_METRIC_NAME
 from autogluon.timeseries.models import DeepARModel, SimpleFeedForwardModel
 from autogluon.timeseries.models.ensemble.greedy_ensemble import TimeSeriesGreedyEnsemble
+from autogluon.timeseries.models.presets import MODEL_TYPES
 from autogluon.timeseries.predictor import TimeSeriesPredictor
 
 from .common import (
@@ -27,6 +28,8 @@ from .common import (
     DUMMY_TS_DATAFRAME,
     PREDICTIONS_FOR_DUMMY_TS_DATAFRAME,
     CustomMetric,
+    DummyDeepARModel,
+    DummySimpleFeedForwardModel,
     get_data_frame_with_variable_lengths,
     get_static_features,
     to_supported_pandas_freq,
@@ -41,6 +44,74 @@ CHRONOS_HYPERPARAMETER_SETTINGS = [
     {"Chronos": {"model_path": "tiny", "context_length": 16}},
     {"Chronos": {"model_path": "tiny", "context_length": 16}, "SeasonalNaive": {"n_jobs": 1}},
 ]
+DUMMY_ITEM_IDS = DUMMY_TS_DATAFRAME.item_ids
+# n_jobs=1 avoids starting a joblib process pool to predict the few time series in DUMMY_TS_DATAFRAME
+PERSIST_TEST_HYPERPARAMETERS = [
+    {"Naive": {"n_jobs": 1}},
+    {"SeasonalNaive": {"n_jobs": 1}},
+    {"Naive": {"n_jobs": 1}, "SeasonalNaive": {"n_jobs": 1}},
+]
+
+
+@pytest.fixture(autouse=True)
+def disable_logging(request):
+    """Skip creating and emitting log records during fit & predict, unless the test is marked with enable_logging."""
+    if request.node.get_closest_marker("enable_logging") is not None:
+        yield
+        return
+    logging.disable(logging.CRITICAL)
+    try:
+        yield
+    finally:
+        logging.disable(logging.NOTSET)
+
+
+@pytest.fixture(scope="session")
+def fitted_predictor_cache(tmp_path_factory):
+    """Fit each predictor configuration only once per test session.
+
+    Returns a function that fits a predictor on ``DUMMY_TS_DATAFRAME`` (with the target column renamed to ``target``)
+    the first time it is called with a given configuration, and on every call loads a fresh copy of the fitted
+    predictor from a new directory, so that tests can modify the returned predictor without affecting each other.
+    """
+    fitted_predictor_paths = {}
+
+    def get_fitted_predictor(hyperparameters, use_tuning_data=True, target="target", **predictor_kwargs):
+        key = repr((hyperparameters, use_tuning_data, target, sorted(predictor_kwargs.items())))
+        if key not in fitted_predictor_paths:
+            df = DUMMY_TS_DATAFRAME.rename(columns={"target": target})
+            predictor = TimeSeriesPredictor(
+                target=target, path=tmp_path_factory.mktemp(str(uuid4())[:6]), **predictor_kwargs
+            )
+            predictor.fit(
+                train_data=df,
+                hyperparameters=hyperparameters,
+                tuning_data=df if use_tuning_data else None,
+            )
+            fitted_predictor_paths[key] = predictor.path
+        predictor_path = tmp_path_factory.mktemp(str(uuid4())[:6])
+        shutil.copytree(fitted_predictor_paths[key], predictor_path, dirs_exist_ok=True)
+        return TimeSeriesPredictor.load(predictor_path)
+
+    return get_fitted_predictor
+
+
+@pytest.fixture(scope="session")
+def prepared_dummy_ts_dataframe():
+    """DUMMY_TS_DATAFRAME sorted by item_id and with a cached frequency, so that the predictor does not need to sort
+    the data and infer its frequency again in every call to fit. Only for tests that don't check the item order.
+    """
+    df = DUMMY_TS_DATAFRAME.sort_index()
+    # accessing the freq property infers the frequency once and caches it in the data frame
+    _ = df.freq
+    return df
+
+
+@pytest.fixture()
+def dummy_deep_learning_models():
+    """Train stubs instead of DeepAR and SimpleFeedForward in tests that only check the predictor control flow."""
+    with mock.patch.dict(MODEL_TYPES, {"DeepAR": DummyDeepARModel, "SimpleFeedForward": DummySimpleFeedForwardModel}):
+        yield
 
 
 def test_predictor_can_be_initialized(temp_model_path):
@@ -62,21 +133,16 @@ def test_when_predictor_called_then_training_is_performed(temp_model_path):
 @pytest.mark.parametrize(
     "hyperparameters", TEST_HYPERPARAMETER_SETTINGS + CHRONOS_HYPERPARAMETER_SETTINGS + ["very_light"]
 )
-def test_given_hyperparameters_when_predictor_called_then_model_can_predict(temp_model_path, hyperparameters):
-    predictor = TimeSeriesPredictor(path=temp_model_path, eval_metric="MAPE", prediction_length=3)
-    predictor.fit(
-        train_data=DUMMY_TS_DATAFRAME,
-        hyperparameters=hyperparameters,
-        tuning_data=DUMMY_TS_DATAFRAME,
-    )
+def test_given_hyperparameters_when_predictor_called_then_model_can_predict(fitted_predictor_cache, hyperparameters):
+    predictor = fitted_predictor_cache(hyperparameters, eval_metric="MAPE", prediction_length=3)
     predictions = predictor.predict(DUMMY_TS_DATAFRAME)
 
     assert isinstance(predictions, TimeSeriesDataFrame)
 
     predicted_item_index = predictions.item_ids
-    assert all(predicted_item_index == DUMMY_TS_DATAFRAME.item_ids)  # noqa
+    assert all(predicted_item_index == DUMMY_ITEM_IDS)  # noqa
     assert all(len(predictions.loc[i]) == 3 for i in predicted_item_index)
-    assert not np.any(np.isnan(predictions))
+    assert not np.isnan(predictions.to_numpy()).any()
 
 
 def test_when_pathlib_path_provided_to_predictor_then_loaded_predictor_can_predict(temp_model_path):
@@ -85,7 +151,6 @@ def test_when_pathlib_path_provided_to_predictor_then_loaded_predictor_can_predi
         train_data=DUMMY_TS_DATAFRAME,
         hyperparameters={"SimpleFeedForward": {"epochs": 1}},
     )
-    predictor.save()
     loaded_predictor = TimeSeriesPredictor.load(predictor.path)
     predictions = loaded_predictor.predict(DUMMY_TS_DATAFRAME)
     assert isinstance(predictions, TimeSeriesDataFrame)
@@ -94,62 +159,43 @@ def test_when_pathlib_path_provided_to_predictor_then_loaded_predictor_can_predi
 @pytest.mark.parametrize(
     "hyperparameters", TEST_HYPERPARAMETER_SETTINGS + CHRONOS_HYPERPARAMETER_SETTINGS + ["very_light"]
 )
-def test_given_different_target_name_when_predictor_called_then_model_can_predict(temp_model_path, hyperparameters):
-    df = TimeSeriesDataFrame(copy.copy(DUMMY_TS_DATAFRAME))
-    df.rename(columns={"target": "mytarget"}, inplace=True)
+def test_given_different_target_name_when_predictor_called_then_model_can_predict(
+    fitted_predictor_cache, hyperparameters
+):
+    df = DUMMY_TS_DATAFRAME.rename(columns={"target": "mytarget"})
 
-    predictor = TimeSeriesPredictor(
-        target="mytarget",
-        path=temp_model_path,
-        eval_metric="MAPE",
-        prediction_length=3,
-    )
-    predictor.fit(
-        train_data=df,
-        hyperparameters=hyperparameters,
+    predictor = fitted_predictor_cache(
+        hyperparameters, use_tuning_data=False, target="mytarget", eval_metric="MAPE", prediction_length=3
     )
     predictions = predictor.predict(df)
 
     assert isinstance(predictions, TimeSeriesDataFrame)
 
     predicted_item_index = predictions.item_ids
-    assert all(predicted_item_index == DUMMY_TS_DATAFRAME.item_ids)  # noqa
+    assert all(predicted_item_index == DUMMY_ITEM_IDS)  # noqa
     assert all(len(predictions.loc[i]) == 3 for i in predicted_item_index)
-    assert not np.any(np.isnan(predictions))
+    assert not np.isnan(predictions.to_numpy()).any()
 
 
 @pytest.mark.parametrize("hyperparameters", TEST_HYPERPARAMETER_SETTINGS + CHRONOS_HYPERPARAMETER_SETTINGS)
-def test_given_no_tuning_data_when_predictor_called_then_model_can_predict(temp_model_path, hyperparameters):
-    predictor = TimeSeriesPredictor(path=temp_model_path, eval_metric="MAPE", prediction_length=3)
-    predictor.fit(
-        train_data=DUMMY_TS_DATAFRAME,
-        hyperparameters=hyperparameters,
-    )
+def test_given_no_tuning_data_when_predictor_called_then_model_can_predict(fitted_predictor_cache, hyperparameters):
+    predictor = fitted_predictor_cache(hyperparameters, use_tuning_data=False, eval_metric="MAPE", prediction_length=3)
     predictions = predictor.predict(DUMMY_TS_DATAFRAME)
 
     assert isinstance(predictions, TimeSeriesDataFrame)
 
     predicted_item_index = predictions.item_ids
-    assert all(predicted_item_index == DUMMY_TS_DATAFRAME.item_ids)  # noqa
+    assert all(predicted_item_index == DUMMY_ITEM_IDS)  # noqa
     assert all(len(predictions.loc[i]) == 3 for i in predicted_item_index)
-    assert not np.any(np.isnan(predictions))
+    assert not np.isnan(predictions.to_numpy()).any()
 
 
 @pytest.mark.parametrize("hyperparameters", TEST_HYPERPARAMETER_SETTINGS)
 def test_given_hyperparameters_and_quantiles_when_predictor_called_then_model_can_predict(
-    temp_model_path, hyperparameters
+    fitted_predictor_cache, hyperparameters
 ):
-    predictor = TimeSeriesPredictor(
-        path=temp_model_path,
-        eval_metric="MAPE",
-        prediction_length=3,
-        quantile_levels=[0.1, 0.4, 0.9],
-    )
-
-    predictor.fit(
-        train_data=DUMMY_TS_DATAFRAME,
-        hyperparameters=hyperparameters,
-        tuning_data=DUMMY_TS_DATAFRAME,
+    predictor = fitted_predictor_cache(
+        hyperparameters, eval_metric="MAPE", prediction_length=3, quantile_levels=[0.1, 0.4, 0.9]
     )
     predictions = predictor.predict(DUMMY_TS_DATAFRAME)
 
@@ -190,18 +236,9 @@ def test_given_hyperparameters_and_custom_models_when_predictor_called_then_lead
 
 @pytest.mark.parametrize("hyperparameters", TEST_HYPERPARAMETER_SETTINGS)
 def test_given_hyperparameters_when_predictor_called_and_loaded_back_then_all_models_can_predict(
-    temp_model_path, hyperparameters
+    fitted_predictor_cache, hyperparameters
 ):
-    predictor = TimeSeriesPredictor(path=temp_model_path, prediction_length=2)
-    predictor.fit(
-        train_data=DUMMY_TS_DATAFRAME,
-        hyperparameters=hyperparameters,
-        tuning_data=DUMMY_TS_DATAFRAME,
-    )
-    predictor.save()
-    del predictor
-
-    loaded_predictor = TimeSeriesPredictor.load(temp_model_path)
+    loaded_predictor = fitted_predictor_cache(hyperparameters, prediction_length=2)
 
     for model_name in loaded_predictor.model_names():
         predictions = loaded_predictor.predict(DUMMY_TS_DATAFRAME, model=model_name)
@@ -209,9 +246,9 @@ def test_given_hyperparameters_when_predictor_called_and_loaded_back_then_all_mo
         assert isinstance(predictions, TimeSeriesDataFrame)
 
         predicted_item_index = predictions.item_ids
-        assert all(predicted_item_index == DUMMY_TS_DATAFRAME.item_ids)  # noqa
+        assert all(predicted_item_index == DUMMY_ITEM_IDS)  # noqa
         assert all(len(predictions.loc[i]) == 2 for i in predicted_item_index)
-        assert not np.any(np.isnan(predictions))
+        assert not np.isnan(predictions.to_numpy()).any()
 
 
 @pytest.mark.skipif(sys.platform.startswith("win"), reason="HPO tests lead to known issues in Windows platform tests")
@@ -261,36 +298,28 @@ def test_given_hp_spaces_and_custom_target_when_predictor_called_predictor_can_p
         assert isinstance(predictions, TimeSeriesDataFrame)
 
         predicted_item_index = predictions.item_ids
-        assert all(predicted_item_index == df.item_ids)  # noqa
+        assert all(predicted_item_index == DUMMY_ITEM_IDS)  # noqa
         assert all(len(predictions.loc[i]) == 2 for i in predicted_item_index)
-        assert not np.any(np.isnan(predictions))
+        assert not np.isnan(predictions.to_numpy()).any()
 
 
 @pytest.mark.parametrize("hyperparameters", TEST_HYPERPARAMETER_SETTINGS)
 def test_given_hyperparameters_when_predictor_called_and_loaded_back_then_loaded_learner_can_predict(
-    temp_model_path, hyperparameters
+    fitted_predictor_cache, hyperparameters
 ):
-    predictor = TimeSeriesPredictor(path=temp_model_path, prediction_length=2)
-    predictor.fit(
-        train_data=DUMMY_TS_DATAFRAME,
-        hyperparameters=hyperparameters,
-        tuning_data=DUMMY_TS_DATAFRAME,
-    )
-    predictor.save()
-    del predictor
-
-    loaded_predictor = TimeSeriesPredictor.load(temp_model_path)
+    loaded_predictor = fitted_predictor_cache(hyperparameters, prediction_length=2)
 
     predictions = loaded_predictor._learner.predict(DUMMY_TS_DATAFRAME)
 
     assert isinstance(predictions, TimeSeriesDataFrame)
 
     predicted_item_index = predictions.item_ids
-    assert all(predicted_item_index == DUMMY_TS_DATAFRAME.item_ids)  # noqa
+    assert all(predicted_item_index == DUMMY_ITEM_IDS)  # noqa
     assert all(len(predictions.loc[i]) == 2 for i in predicted_item_index)
-    assert not np.any(np.isnan(predictions))
+    assert not np.isnan(predictions.to_numpy()).any()
 
 
+@pytest.mark.usefixtures("dummy_deep_learning_models")
 def test_given_enable_ensemble_true_when_predictor_called_then_ensemble_is_fitted(temp_model_path):
     predictor = TimeSeriesPredictor(
         path=temp_model_path,
@@ -306,6 +335,7 @@ def test_given_enable_ensemble_true_when_predictor_called_then_ensemble_is_fitte
     assert any("ensemble" in n.lower() for n in predictor.model_names())
 
 
+@pytest.mark.usefixtures("dummy_deep_learning_models")
 def test_given_enable_ensemble_true_and_only_one_model_when_predictor_called_then_ensemble_is_not_fitted(
     temp_model_path,
 ):
@@ -320,6 +350,7 @@ def test_given_enable_ensemble_true_and_only_one_model_when_predictor_called_the
     assert not any("ensemble" in n.lower() for n in predictor.model_names())
 
 
+@pytest.mark.usefixtures("dummy_deep_learning_models")
 def test_given_enable_ensemble_false_when_predictor_called_then_ensemble_is_not_fitted(temp_model_path):
     predictor = TimeSeriesPredictor(
         path=temp_model_path,
@@ -392,14 +423,6 @@ def test_given_mixed_searchspace_and_hyperparameter_tune_kwargs_when_predictor_f
     )
 
 
-@pytest.mark.parametrize("target_column", ["target", "CUSTOM_TARGET"])
-def test_when_target_included_in_known_covariates_then_exception_is_raised(temp_model_path, target_column):
-    with pytest.raises(ValueError, match="cannot be one of the known covariates"):
-        TimeSeriesPredictor(
-            path=temp_model_path, target=target_column, known_covariates_names=["Y", target_column, "X"]
-        )
-
-
 EXPECTED_FIT_SUMMARY_KEYS = [
     "model_types",
     "model_performance",
@@ -412,26 +435,6 @@ EXPECTED_FIT_SUMMARY_KEYS = [
 ]
 
 
-@pytest.mark.parametrize(
-    "hyperparameters, num_models",
-    [
-        ({"Naive": {}}, 1),
-        ({"Naive": {}, "DeepAR": {"epochs": 1, "num_batches_per_epoch": 1}}, 3),  # + 1 for ensemble
-    ],
-)
-def test_when_fit_summary_is_called_then_all_keys_and_models_are_included(
-    temp_model_path, hyperparameters, num_models
-):
-    predictor = TimeSeriesPredictor(path=temp_model_path)
-    predictor.fit(DUMMY_TS_DATAFRAME, hyperparameters=hyperparameters)
-    fit_summary = predictor.fit_summary()
-    for key in EXPECTED_FIT_SUMMARY_KEYS:
-        assert key in fit_summary
-        # All keys except model_best return a dict with results per model
-        if key != "model_best":
-            assert len(fit_summary[key]) == num_models
-
-
 EXPECTED_INFO_KEYS = [
     "path",
     "version",
@@ -444,6 +447,7 @@ EXPECTED_INFO_KEYS = [
 ]
 
 
+@pytest.mark.usefixtures("dummy_deep_learning_models")
 @pytest.mark.parametrize(
     "hyperparameters, num_models",
     [
@@ -451,22 +455,27 @@ EXPECTED_INFO_KEYS = [
         ({"Naive": {}, "DeepAR": {"epochs": 1, "num_batches_per_epoch": 1}}, 3),  # + 1 for ensemble
     ],
 )
-def test_when_info_is_called_then_all_keys_and_models_are_included(temp_model_path, hyperparameters, num_models):
+def test_when_fit_summary_and_info_are_called_then_all_keys_and_models_are_included(
+    temp_model_path, hyperparameters, num_models
+):
     predictor = TimeSeriesPredictor(path=temp_model_path)
     predictor.fit(DUMMY_TS_DATAFRAME, hyperparameters=hyperparameters)
+
+    fit_summary = predictor.fit_summary()
+    for key in EXPECTED_FIT_SUMMARY_KEYS:
+        assert key in fit_summary
+        # All keys except model_best return a dict with results per model
+        if key != "model_best":
+            assert len(fit_summary[key]) == num_models
+
     info = predictor.info()
     for key in EXPECTED_INFO_KEYS:
         assert key in info
-
     assert len(info["model_info"]) == num_models
 
 
-def test_when_predictor_is_loaded_then_info_works(temp_model_path):
-    predictor = TimeSeriesPredictor(path=temp_model_path, prediction_length=2)
-    predictor.fit(train_data=DUMMY_TS_DATAFRAME, hyperparameters=DUMMY_HYPERPARAMETERS)
-    predictor.save()
-    del predictor
-    predictor = TimeSeriesPredictor.load(temp_model_path)
+def test_when_predictor_is_loaded_then_info_works(fitted_predictor_cache):
+    predictor = fitted_predictor_cache(DUMMY_HYPERPARAMETERS, use_tuning_data=False, prediction_length=2)
     info = predictor.info()
     for key in EXPECTED_INFO_KEYS:
         assert key in info
@@ -485,26 +494,28 @@ def test_when_train_data_contains_nans_then_predictor_can_fit(temp_model_path):
     assert "SimpleFeedForward" in predictor.model_names()
 
 
-def test_when_prediction_data_contains_nans_then_predictor_can_predict(temp_model_path):
-    predictor = TimeSeriesPredictor(path=temp_model_path)
-    predictor.fit(DUMMY_TS_DATAFRAME, hyperparameters={"Naive": {}})
+def test_when_prediction_data_contains_nans_then_predictor_can_predict(fitted_predictor_cache):
+    predictor = fitted_predictor_cache({"Naive": {}}, use_tuning_data=False)
     df = DATAFRAME_WITH_COVARIATES.copy()
     df.iloc[5] = np.nan
     predictions = predictor.predict(df)
     assert isinstance(predictions, TimeSeriesDataFrame)
-    assert not np.any(np.isnan(predictions))
+    assert not np.isnan(predictions.to_numpy()).any()
+
+
+# the first time series contains only NaNs
+DATAFRAME_WITH_ALL_NAN_SERIES = TimeSeriesDataFrame.from_iterable_dataset(
+    [
+        {"target": [float("nan")] * 10, "start": pd.Period("2020-01-01", "D")},
+        {"target": [float(5)] * 10, "start": pd.Period("2020-01-01", "D")},
+    ]
+)
 
 
 def test_when_some_train_time_series_contain_only_nans_then_they_are_removed_from_train_data(temp_model_path):
     predictor = TimeSeriesPredictor(path=temp_model_path)
-    train_data = TimeSeriesDataFrame.from_iterable_dataset(
-        [
-            {"target": [float("nan")] * 10, "start": pd.Period("2020-01-01", "D")},
-            {"target": [float(5)] * 10, "start": pd.Period("2020-01-01", "D")},
-        ]
-    )
     with mock.patch("autogluon.timeseries.learner.TimeSeriesLearner.fit") as mock_learner_fit:
-        predictor.fit(train_data)
+        predictor.fit(DATAFRAME_WITH_ALL_NAN_SERIES)
         learner_train_data = mock_learner_fit.call_args[1]["train_data"]
         assert all(learner_train_data.item_ids == [1])
 
@@ -526,26 +537,38 @@ def test_when_all_nan_data_passed_to_predict_then_predictor_can_predict(temp_mod
     assert not predictions.isna().any(axis=None) and all(predictions.item_ids == data.item_ids)
 
 
+# last 3 time steps of each series, i.e., only the forecast horizon of a predictor with prediction_length=3
+FUTURE_ONLY_DUMMY_TS_DATAFRAME = DUMMY_TS_DATAFRAME.slice_by_timestep(-3, None)
+
+
 @pytest.mark.parametrize("method", ["evaluate", "leaderboard"])
-def test_when_scoring_method_receives_only_future_data_then_exception_is_raised(temp_model_path, method):
-    prediction_length = 3
-    predictor = TimeSeriesPredictor(path=temp_model_path, prediction_length=prediction_length)
-    predictor.fit(DUMMY_TS_DATAFRAME, hyperparameters={"Naive": {}})
-    future_data = DUMMY_TS_DATAFRAME.slice_by_timestep(-prediction_length, None)
+def test_when_scoring_method_receives_only_future_data_then_exception_is_raised(fitted_predictor_cache, method):
+    predictor = fitted_predictor_cache({"Naive": {}}, use_tuning_data=False, prediction_length=3)
     with pytest.raises(ValueError, match=" data includes both historic and future data"):
-        getattr(predictor, method)(data=future_data)
+        getattr(predictor, method)(data=FUTURE_ONLY_DUMMY_TS_DATAFRAME)
 
 
 def test_when_fit_receives_only_future_data_as_tuning_data_then_exception_is_raised(temp_model_path):
-    prediction_length = 3
-    predictor = TimeSeriesPredictor(path=temp_model_path, prediction_length=prediction_length)
-    future_data = DUMMY_TS_DATAFRAME.slice_by_timestep(-prediction_length, None)
+    predictor = TimeSeriesPredictor(path=temp_model_path, prediction_length=3)
     with pytest.raises(ValueError, match="tuning\_data includes both historic and future data"):
-        predictor.fit(DUMMY_TS_DATAFRAME, hyperparameters={"Naive": {}}, tuning_data=future_data)
+        predictor.fit(DUMMY_TS_DATAFRAME, hyperparameters={"Naive": {}}, tuning_data=FUTURE_ONLY_DUMMY_TS_DATAFRAME)
+
+
+@pytest.fixture(scope="module")
+def dummy_df_in_long_format():
+    # reset_index() preserves the TimeSeriesDataFrame type, so we convert the result to a pd.DataFrame
+    return pd.DataFrame(DUMMY_TS_DATAFRAME.reset_index())
+
 
+@pytest.fixture(scope="module")
+def dummy_csv_path(tmp_path_factory, dummy_df_in_long_format):
+    data_path = tmp_path_factory.mktemp(str(uuid4())[:6]) / "data.csv"
+    dummy_df_in_long_format.to_csv(data_path, index=False)
+    return data_path
 
-def test_given_data_is_in_dataframe_format_then_predictor_works(temp_model_path):
-    df = pd.DataFrame(DUMMY_TS_DATAFRAME.reset_index())
+
+def test_given_data_is_in_dataframe_format_then_predictor_works(temp_model_path, dummy_df_in_long_format):
+    df = dummy_df_in_long_format
     predictor = TimeSeriesPredictor(path=temp_model_path)
     predictor.fit(df, hyperparameters={"Naive": {}})
     predictor.leaderboard(df)
@@ -555,12 +578,8 @@ def test_given_data_is_in_dataframe_format_then_predictor_works(temp_model_path)
 
 
 @pytest.mark.parametrize("path_format", [str, Path])
-def test_given_data_is_in_str_format_then_predictor_works(temp_model_path, tmp_path, path_format):
-    df = pd.DataFrame(DUMMY_TS_DATAFRAME.reset_index())
-    tmp_path_subdir = tmp_path / str(uuid4())[:4]
-    data_path = path_format(str(tmp_path_subdir))
-
-    df.to_csv(data_path, index=False)
+def test_given_data_is_in_str_format_then_predictor_works(temp_model_path, dummy_csv_path, path_format):
+    data_path = path_format(str(dummy_csv_path))
 
     predictor = TimeSeriesPredictor(path=temp_model_path)
     predictor.fit(data_path, hyperparameters={"Naive": {}})
@@ -572,46 +591,60 @@ def test_given_data_is_in_str_format_then_predictor_works(temp_model_path, tmp_p
 
 
 @pytest.mark.parametrize("rename_columns", [{TIMESTAMP: "custom_timestamp"}, {ITEMID: "custom_item_id"}])
-def test_given_data_cannot_be_interpreted_as_tsdf_then_exception_raised(temp_model_path, rename_columns):
-    df = pd.DataFrame(DUMMY_TS_DATAFRAME.reset_index())
-    df = df.rename(columns=rename_columns)
+def test_given_data_cannot_be_interpreted_as_tsdf_then_exception_raised(
+    temp_model_path, dummy_df_in_long_format, rename_columns
+):
+    df = dummy_df_in_long_format.rename(columns=rename_columns)
     predictor = TimeSeriesPredictor(path=temp_model_path)
     with pytest.raises(ValueError, match="cannot be automatically converted to a TimeSeriesDataFrame"):
         predictor.fit(df, hyperparameters={"Naive": {}})
 
 
-def test_given_data_is_not_sorted_then_predictor_can_fit_and_predict(temp_model_path):
-    shuffled_df = pd.DataFrame(DUMMY_TS_DATAFRAME).sample(frac=1.0)
-    ts_df = TimeSeriesDataFrame(shuffled_df)
+@pytest.fixture(scope="module")
+def shuffled_dummy_ts_df():
+    return TimeSeriesDataFrame(pd.DataFrame(DUMMY_TS_DATAFRAME).sample(frac=1.0, random_state=0))
 
-    predictor = TimeSeriesPredictor(path=temp_model_path, prediction_length=2)
-    predictor.fit(ts_df, hyperparameters={"Naive": {}})
-    predictions = predictor.predict(ts_df)
-    assert len(predictions) == predictor.prediction_length * ts_df.num_items
 
+def test_given_data_is_not_sorted_then_predictor_can_fit_and_predict(temp_model_path, shuffled_dummy_ts_df):
+    predictor = TimeSeriesPredictor(path=temp_model_path, prediction_length=2)
+    predictor.fit(shuffled_dummy_ts_df, hyperparameters={"Naive": {}})
+    predictions = predictor.predict(shuffled_dummy_ts_df)
+    assert len(predictions) == predictor.prediction_length * shuffled_dummy_ts_df.num_items
 
-def test_given_data_is_not_sorted_then_preprocessed_data_is_sorted(temp_model_path):
-    shuffled_df = pd.DataFrame(DUMMY_TS_DATAFRAME).sample(frac=1.0)
-    ts_df = TimeSeriesDataFrame(shuffled_df)
 
+def test_given_data_is_not_sorted_then_preprocessed_data_is_sorted(temp_model_path, shuffled_dummy_ts_df):
     predictor = TimeSeriesPredictor(path=temp_model_path)
-    ts_df_processed = predictor._check_and_prepare_data_frame(ts_df)
+    ts_df_processed = predictor._check_and_prepare_data_frame(shuffled_dummy_ts_df)
     assert ts_df_processed.index.is_monotonic_increasing
 
 
-def test_when_both_argument_aliases_are_passed_to_init_then_exception_is_raised(temp_model_path):
-    with pytest.raises(ValueError, match="Please specify at most one of these arguments"):
-        TimeSeriesPredictor(path=temp_model_path, target="custom_target", label="custom_target")
-
-
-def test_when_invalid_argument_passed_to_init_then_exception_is_raised(temp_model_path):
-    with pytest.raises(TypeError, match="unexpected keyword argument 'invalid_argument'"):
-        TimeSeriesPredictor(path=temp_model_path, invalid_argument=23)
-
-
-def test_when_ignore_time_index_passed_to_predictor_then_exception_is_raised(temp_model_path):
-    with pytest.raises(TypeError, match="has been deprecated"):
-        TimeSeriesPredictor(path=temp_model_path, ignore_time_index=True)
+@pytest.mark.parametrize(
+    "init_kwargs, error_type, match",
+    [
+        (
+            {"target": "custom_target", "label": "custom_target"},
+            ValueError,
+            "Please specify at most one of these arguments",
+        ),
+        ({"invalid_argument": 23}, TypeError, "unexpected keyword argument 'invalid_argument'"),
+        ({"ignore_time_index": True}, TypeError, "has been deprecated"),
+        (
+            {"target": "target", "known_covariates_names": ["Y", "target", "X"]},
+            ValueError,
+            "cannot be one of the known covariates",
+        ),
+        (
+            {"target": "CUSTOM_TARGET", "known_covariates_names": ["Y", "CUSTOM_TARGET", "X"]},
+            ValueError,
+            "cannot be one of the known covariates",
+        ),
+    ],
+)
+def test_when_invalid_arguments_passed_to_init_then_exception_is_raised(
+    temp_model_path, init_kwargs, error_type, match
+):
+    with pytest.raises(error_type, match=match):
+        TimeSeriesPredictor(path=temp_model_path, log_to_file=False, **init_kwargs)
 
 
 def test_when_invalid_argument_passed_to_fit_then_exception_is_raised(temp_model_path):
@@ -620,6 +653,7 @@ def test_when_invalid_argument_passed_to_fit_then_exception_is_raised(temp_model
         predictor.fit(DUMMY_TS_DATAFRAME, invalid_argument=23)
 
 
+@pytest.mark.usefixtures("dummy_deep_learning_models")
 @pytest.mark.parametrize("set_best_to_refit_full", [True, False])
 def test_when_refit_full_called_then_best_model_is_updated(temp_model_path, set_best_to_refit_full):
     predictor = TimeSeriesPredictor(path=temp_model_path)
@@ -639,6 +673,7 @@ def test_when_refit_full_called_then_best_model_is_updated(temp_model_path, set_
         assert model_best_after == model_best_before
 
 
+@pytest.mark.usefixtures("dummy_deep_learning_models")
 @pytest.mark.parametrize("tuning_data, refit_called", [(None, True), (DUMMY_TS_DATAFRAME, False)])
 def test_when_refit_full_is_passed_to_fit_then_refit_full_is_skipped(temp_model_path, tuning_data, refit_called):
     predictor = TimeSeriesPredictor(path=temp_model_path)
@@ -655,6 +690,7 @@ def test_when_refit_full_is_passed_to_fit_then_refit_full_is_skipped(temp_model_
             refit_method.assert_not_called()
 
 
+@pytest.mark.usefixtures("dummy_deep_learning_models")
 def test_when_excluded_model_names_provided_then_excluded_models_are_not_trained(temp_model_path):
     predictor = TimeSeriesPredictor(path=temp_model_path)
     predictor.fit(
@@ -666,15 +702,15 @@ def test_when_excluded_model_names_provided_then_excluded_models_are_not_trained
         excluded_model_types=["DeepAR"],
     )
     leaderboard = predictor.leaderboard()
-    assert leaderboard["model"].values == ["SimpleFeedForward"]
+    assert leaderboard["model"].tolist() == ["DummySimpleFeedForward"]
 
 
 @pytest.mark.parametrize("method_name", ["leaderboard", "predict", "evaluate"])
 @pytest.mark.parametrize("use_cache", [True, False])
-def test_when_use_cache_is_set_to_false_then_cached_predictions_are_ignored(temp_model_path, use_cache, method_name):
-    predictor = TimeSeriesPredictor(path=temp_model_path, cache_predictions=True).fit(
-        DUMMY_TS_DATAFRAME, hyperparameters={"Naive": {}}
-    )
+def test_when_use_cache_is_set_to_false_then_cached_predictions_are_ignored(
+    fitted_predictor_cache, use_cache, method_name
+):
+    predictor = fitted_predictor_cache({"Naive": {}}, use_tuning_data=False, cache_predictions=True)
     # Cache predictions
     predictor.predict(DUMMY_TS_DATAFRAME)
 
@@ -731,35 +767,15 @@ def test_when_use_cache_is_set_to_false_then_cached_predictions_are_ignored(temp
     ],
 )
 def irregular_timestamp_data_frame(request):
-    df_tuples = []
-    for i, ts in enumerate(request.param):
-        for t in ts:
-            df_tuples.append((i, pd.Timestamp(t), np.random.rand()))
-    return TimeSeriesDataFrame.from_data_frame(pd.DataFrame(df_tuples, columns=[ITEMID, TIMESTAMP, "target"]))
+    item_ids = np.repeat(np.arange(len(request.param)), [len(ts) for ts in request.param])
+    timestamps = pd.to_datetime(np.concatenate(request.param))
+    df = pd.DataFrame({ITEMID: item_ids, TIMESTAMP: timestamps, "target": np.random.rand(len(timestamps))})
+    return TimeSeriesDataFrame.from_data_frame(df)
 
 
+@pytest.mark.parametrize("use_tuning_data", [True, False])
 def test_given_irregular_time_series_when_predictor_called_with_freq_then_predictor_can_predict(
-    temp_model_path, irregular_timestamp_data_frame
-):
-    df = irregular_timestamp_data_frame
-    predictor = TimeSeriesPredictor(
-        path=temp_model_path,
-        freq="D",
-    )
-    predictor.fit(
-        train_data=df,
-        hyperparameters=TEST_HYPERPARAMETER_SETTINGS[0],
-        tuning_data=df,
-    )
-    predictions = predictor.predict(df)
-    assert isinstance(df, TimeSeriesDataFrame)
-    assert not np.any(np.isnan(predictions))
-    assert all(len(predictions.loc[i]) == 1 for i in df.item_ids)
-    assert "SimpleFeedForward" in predictor.model_names()
-
-
-def test_given_irregular_time_series_and_no_tuning_when_predictor_called_with_freq_then_predictor_can_predict(
-    temp_model_path, irregular_timestamp_data_frame
+    temp_model_path, irregular_timestamp_data_frame, use_tuning_data
 ):
     df = irregular_timestamp_data_frame
     predictor = TimeSeriesPredictor(
@@ -769,10 +785,11 @@ def test_given_irregular_time_series_and_no_tuning_when_predictor_called_with_fr
     predictor.fit(
         train_data=df,
         hyperparameters=TEST_HYPERPARAMETER_SETTINGS[0],
+        tuning_data=df if use_tuning_data else None,
     )
     predictions = predictor.predict(df)
     assert isinstance(df, TimeSeriesDataFrame)
-    assert not np.any(np.isnan(predictions))
+    assert not np.isnan(predictions.to_numpy()).any()
     assert all(len(predictions.loc[i]) == 1 for i in df.item_ids)
     assert "SimpleFeedForward" in predictor.model_names()
 
@@ -832,7 +849,6 @@ def test_given_regular_time_series_when_predictor_loaded_from_disk_then_inferred
         train_data=DUMMY_TS_DATAFRAME,
         hyperparameters=TEST_HYPERPARAMETER_SETTINGS[0],
     )
-    predictor.save()
     del predictor
 
     loaded_predictor = TimeSeriesPredictor.load(temp_model_path)
@@ -971,16 +987,14 @@ def test_given_refit_every_n_windows_when_fit_then_model_is_fit_correct_number_o
     assert actual_num_refits == expected_num_refits
 
 
-def test_given_custom_metric_when_creating_predictor_then_predictor_can_evaluate(temp_model_path):
-    predictor = TimeSeriesPredictor(path=temp_model_path, eval_metric=CustomMetric())
-    predictor.fit(DUMMY_TS_DATAFRAME, hyperparameters={"Naive": {}})
+def test_given_custom_metric_when_creating_predictor_then_predictor_can_evaluate(fitted_predictor_cache):
+    predictor = fitted_predictor_cache({"Naive": {}}, use_tuning_data=False, eval_metric=CustomMetric())
     scores = predictor.evaluate(DUMMY_TS_DATAFRAME)
     assert isinstance(scores[predictor.eval_metric.name], float)
 
 
-def test_when_custom_metric_passed_to_score_then_predictor_can_evaluate(temp_model_path):
-    predictor = TimeSeriesPredictor(path=temp_model_path, eval_metric="MASE")
-    predictor.fit(DUMMY_TS_DATAFRAME, hyperparameters={"Naive": {}})
+def test_when_custom_metric_passed_to_score_then_predictor_can_evaluate(fitted_predictor_cache):
+    predictor = fitted_predictor_cache({"Naive": {}}, use_tuning_data=False, eval_metric="MASE")
     eval_metric = CustomMetric()
     scores = predictor.evaluate(DUMMY_TS_DATAFRAME, metrics=eval_metric)
     assert isinstance(scores[eval_metric.name], float)
@@ -999,15 +1013,13 @@ def test_when_custom_metric_passed_to_score_then_predictor_can_evaluate(temp_mod
     ],
 )
 def test_when_evaluate_receives_multiple_metrics_then_score_dict_contains_all_keys(
-    temp_model_path, fit_metric, metrics_passed_to_eval, expected_keys
+    fitted_predictor_cache, fit_metric, metrics_passed_to_eval, expected_keys
 ):
-    predictor = TimeSeriesPredictor(path=temp_model_path, eval_metric=fit_metric)
-    predictor.fit(DUMMY_TS_DATAFRAME, hyperparameters={"Naive": {}})
+    predictor = fitted_predictor_cache({"Naive": {}}, use_tuning_data=False, eval_metric=fit_metric)
     scores = predictor.evaluate(DUMMY_TS_DATAFRAME, metrics=metrics_passed_to_eval)
     assert len(scores) == len(expected_keys) and all(k in scores for k in expected_keys)
 
 
-@pytest.mark.parametrize("enable_ensemble", [True, False])
 @pytest.mark.parametrize(
     "hyperparameters, hyperparameter_tune_kwargs",
     [
@@ -1022,10 +1034,11 @@ def test_when_evaluate_receives_multiple_metrics_then_score_dict_contains_all_ke
     ],
 )
 def test_given_time_limit_is_not_none_then_first_model_doesnt_receive_full_time_limit(
-    temp_model_path, enable_ensemble, hyperparameters, hyperparameter_tune_kwargs
+    temp_model_path, hyperparameters, hyperparameter_tune_kwargs
 ):
+    # With the ensemble enabled, time is also reserved for the ensemble, which gives the strictest bound to check
     time_limit = 20
-    expected_time_limit_for_first_model = time_limit / (len(hyperparameters) + int(enable_ensemble)) + 0.1
+    expected_time_limit_for_first_model = time_limit / (len(hyperparameters) + 1) + 0.1
     predictor = TimeSeriesPredictor(path=temp_model_path)
     with mock.patch("autogluon.timeseries.models.local.naive.SeasonalNaiveModel.fit") as snaive_fit:
         predictor.fit(
@@ -1033,7 +1046,7 @@ def test_given_time_limit_is_not_none_then_first_model_doesnt_receive_full_time_
             time_limit=time_limit,
             hyperparameters=hyperparameters,
             hyperparameter_tune_kwargs=hyperparameter_tune_kwargs,
-            enable_ensemble=enable_ensemble,
+            enable_ensemble=True,
         )
         assert snaive_fit.call_args[1]["time_limit"] < expected_time_limit_for_first_model
 
@@ -1041,9 +1054,8 @@ def test_given_time_limit_is_not_none_then_first_model_doesnt_receive_full_time_
 @pytest.mark.parametrize("num_val_windows", [1, 5])
 @pytest.mark.parametrize("refit_every_n_windows", [1, 2, 5, 6])
 @pytest.mark.parametrize("time_limit", [15, 60])
-@pytest.mark.parametrize("enable_ensemble", [True, False])
 def test_given_time_limit_is_not_none_then_time_is_distributed_across_windows_for_global_models(
-    temp_model_path, num_val_windows, time_limit, refit_every_n_windows, enable_ensemble
+    temp_model_path, num_val_windows, time_limit, refit_every_n_windows
 ):
     data = get_data_frame_with_variable_lengths({"A": 100, "B": 100})
     num_refits = math.ceil(num_val_windows / refit_every_n_windows)
@@ -1051,88 +1063,58 @@ def test_given_time_limit_is_not_none_then_time_is_distributed_across_windows_fo
 
     predictor = TimeSeriesPredictor(path=temp_model_path, prediction_length=5)
     with mock.patch("autogluon.timeseries.models.RecursiveTabularModel.fit") as mock_fit:
+        # Failing in the first window stops training early; the error is caught and logged by the trainer
         mock_fit.side_effect = RuntimeError("Numerical error")
-        try:
-            predictor.fit(
-                data,
-                time_limit=time_limit,
-                hyperparameters={"RecursiveTabular": {"tabular_hyperparameters": {"DUMMY": {}}}},
-                num_val_windows=num_val_windows,
-                refit_every_n_windows=refit_every_n_windows,
-                enable_ensemble=enable_ensemble,
-            )
-        except RuntimeError:
-            pass
+        predictor.fit(
+            data,
+            time_limit=time_limit,
+            hyperparameters={"RecursiveTabular": {"tabular_hyperparameters": {"DUMMY": {}}}},
+            num_val_windows=num_val_windows,
+            refit_every_n_windows=refit_every_n_windows,
+            enable_ensemble=False,
+        )
+        assert mock_fit.call_count == 1
         assert mock_fit.call_args[1]["time_limit"] < expected_time_limit_for_first_model
 
 
-def test_when_log_to_file_set_then_predictor_logs_to_file(temp_model_path):
-    predictor = TimeSeriesPredictor(path=temp_model_path, log_to_file=True)
-    predictor.fit(DUMMY_TS_DATAFRAME, hyperparameters={"Naive": {}})
-    log_path = Path(temp_model_path) / "logs/predictor_log.txt"
-    assert Path.exists(log_path)
-
-    # check if the log contains text
-    with open(log_path, "r") as f:
-        log_text = f.read()
-    assert "Naive" in log_text
-
-
-def test_when_log_file_set_then_predictor_logs_to_custom_file(temp_model_path):
-    predictor = TimeSeriesPredictor(path=temp_model_path, log_to_file=True, log_file_path="custom_log.txt")
-    log_path = Path(".") / "custom_log.txt"
-    try:
-        predictor.fit(DUMMY_TS_DATAFRAME, hyperparameters={"Naive": {}})
-        assert Path.exists(log_path)
-
-        # check if the log contains text
-        with open(log_path, "r") as f:
-            log_text = f.read()
-        assert "Naive" in log_text
-    finally:
-        try:
-            log_path.unlink(missing_ok=True)
-        except PermissionError:
-            # Windows won't allow to clean up the directory if logs are saved to it;
-            # Permission Error: The process can't access the file since it is being used by another process
-            # skip deletion
-            pass
+@pytest.mark.enable_logging
+@pytest.mark.parametrize(
+    "log_to_file, custom_log_path_format",
+    [
+        (True, None),  # default log file in the predictor directory
+        (True, str),
+        (True, Path),
+        (False, None),
+    ],
+)
+def test_when_log_to_file_set_then_predictor_logs_to_expected_file(
+    temp_model_path, tmp_path, log_to_file, custom_log_path_format
+):
+    if custom_log_path_format is None:
+        log_file_path = "auto"
+        log_path = Path(temp_model_path) / "logs/predictor_log.txt"
+    else:
+        log_path = tmp_path / "custom_log.txt"
+        log_file_path = custom_log_path_format(log_path)
 
+    predictor = TimeSeriesPredictor(path=temp_model_path, log_to_file=log_to_file, log_file_path=log_file_path)
+    predictor.fit(DUMMY_TS_DATAFRAME, hyperparameters={"Naive": {}})
 
-def test_when_log_file_set_with_pathlib_then_predictor_logs_to_custom_file(temp_model_path):
-    predictor = TimeSeriesPredictor(path=temp_model_path, log_to_file=True, log_file_path=Path(".") / "custom_log.txt")
-    log_path = Path(".") / "custom_log.txt"
-    try:
-        predictor.fit(DUMMY_TS_DATAFRAME, hyperparameters={"Naive": {}})
+    if log_to_file:
         assert Path.exists(log_path)
-
         # check if the log contains text
         with open(log_path, "r") as f:
             log_text = f.read()
         assert "Naive" in log_text
-    finally:
-        try:
-            log_path.unlink(missing_ok=True)
-        except PermissionError:
-            # Windows won't allow to clean up the directory if logs are saved to it;
-            # Permission Error: The process can't access the file since it is being used by another process
-            # skip deletion
-            pass
-
-
-def test_when_log_to_file_set_to_false_then_predictor_does_not_log_to_file(temp_model_path):
-    predictor = TimeSeriesPredictor(path=temp_model_path, log_to_file=False)
-    predictor.fit(DUMMY_TS_DATAFRAME, hyperparameters={"Naive": {}})
-    log_path = Path(temp_model_path) / "logs/predictor_log.txt"
-    assert not Path.exists(log_path)
+    else:
+        assert not Path.exists(log_path)
 
 
 @pytest.mark.parametrize("verbosity", [-1, 0, 1, 2, 3, 4, 5])
 def test_when_predictor_init_with_verbosity_then_verbosity_propagates_to_all_loggers(temp_model_path, verbosity):
     logger_suffixes = ["learner", "trainer", "abstract_local_model"]
 
-    predictor = TimeSeriesPredictor(path=temp_model_path, log_to_file=False, verbosity=verbosity)
-    predictor.fit(DUMMY_TS_DATAFRAME, hyperparameters={"Naive": {}})
+    TimeSeriesPredictor(path=temp_model_path, log_to_file=False, verbosity=verbosity)
 
     for suffix in logger_suffixes:
         level = logging.getLogger(f"autogluon.timeseries.{suffix}").getEffectiveLevel()
@@ -1153,6 +1135,19 @@ def test_when_predictor_fit_with_verbosity_then_verbosity_overridden_and_propaga
         assert level == verbosity2loglevel(verbosity)
 
 
+def test_when_predictor_fit_without_verbosity_then_init_verbosity_propagates_to_all_loggers(temp_model_path):
+    logger_suffixes = ["learner", "trainer", "abstract_local_model"]
+    verbosity = 3
+
+    predictor = TimeSeriesPredictor(path=temp_model_path, log_to_file=False, verbosity=verbosity)
+    logging.getLogger("autogluon.timeseries").setLevel(logging.ERROR)
+    predictor.fit(DUMMY_TS_DATAFRAME, hyperparameters={"Naive": {}})
+
+    for suffix in logger_suffixes:
+        level = logging.getLogger(f"autogluon.timeseries.{suffix}").getEffectiveLevel()
+        assert level == verbosity2loglevel(verbosity)
+
+
 @pytest.mark.parametrize("random_seed", [123, 42])
 def test_when_predictor_predict_called_with_random_seed_then_torch_seed_set_for_all_predictions(
     temp_model_path, random_seed
@@ -1163,7 +1158,7 @@ def test_when_predictor_predict_called_with_random_seed_then_torch_seed_set_for_
         DUMMY_TS_DATAFRAME,
         hyperparameters={
             "SeasonalNaive": {},
-            "DeepAR": {"epochs": 1},
+            "Naive": {},
         },
         random_seed=random_seed,
         enable_ensemble=False,
@@ -1172,7 +1167,7 @@ def test_when_predictor_predict_called_with_random_seed_then_torch_seed_set_for_
     import torch
 
     def predict_model_side_effect(*args, **kwargs):
-        assert torch.get_rng_state().numpy()[0] == random_seed
+        assert torch.initial_seed() == random_seed
         return DUMMY_TS_DATAFRAME
 
     with mock.patch("autogluon.timeseries.trainer.AbstractTimeSeriesTrainer._predict_model") as mock_predict_model:
@@ -1192,11 +1187,12 @@ def test_when_predictor_predict_called_with_random_seed_then_torch_seed_set_for_
     "max_num_item_ids, item_ids, expected_num_subplots",
     [
         (1, None, 1),
-        (8, DUMMY_TS_DATAFRAME.item_ids[:2], 2),
-        (3, DUMMY_TS_DATAFRAME.item_ids, 3),
+        (8, DUMMY_ITEM_IDS[:2], 2),
+        (3, DUMMY_ITEM_IDS, 3),
     ],
 )
 def test_when_plot_called_then_figure_contains_correct_number_of_subplots(
+    temp_model_path,
     predictions,
     quantile_levels,
     item_ids,
@@ -1205,7 +1201,9 @@ def test_when_plot_called_then_figure_contains_correct_number_of_subplots(
     point_forecast_column,
     expected_num_subplots,
 ):
-    fig = TimeSeriesPredictor().plot(
+    import matplotlib.pyplot as plt
+
+    fig = TimeSeriesPredictor(path=temp_model_path, log_to_file=False).plot(
         DUMMY_TS_DATAFRAME,
         predictions=predictions,
         quantile_levels=quantile_levels,
@@ -1223,9 +1221,11 @@ def test_when_plot_called_then_figure_contains_correct_number_of_subplots(
     "selected_columns",
     [["mean"], ["mean", "0.1"], ["mean", "0.5"], ["mean", "0.5", "0.8"], ["mean", "0.1", "0.2", "0.4"]],
 )
-def test_when_not_all_quantile_forecasts_available_then_predictor_can_plot(selected_columns):
+def test_when_not_all_quantile_forecasts_available_then_predictor_can_plot(temp_model_path, selected_columns):
+    import matplotlib.pyplot as plt
+
     max_num_item_ids = 3
-    fig = TimeSeriesPredictor().plot(
+    fig = TimeSeriesPredictor(path=temp_model_path, log_to_file=False).plot(
         DUMMY_TS_DATAFRAME,
         predictions=PREDICTIONS_FOR_DUMMY_TS_DATAFRAME[selected_columns],
         max_num_item_ids=max_num_item_ids,
@@ -1243,9 +1243,9 @@ def test_when_not_all_quantile_forecasts_available_then_predictor_can_plot(selec
         PREDICTIONS_FOR_DUMMY_TS_DATAFRAME.loc[PREDICTIONS_FOR_DUMMY_TS_DATAFRAME.item_ids[0]],
     ],
 )
-def test_when_predictions_for_plot_have_incorrect_format_then_exception_is_raised(predictions):
+def test_when_predictions_for_plot_have_incorrect_format_then_exception_is_raised(temp_model_path, predictions):
     with pytest.raises(ValueError, match="predictions must be a TimeSeriesDataFrame"):
-        TimeSeriesPredictor().plot(DUMMY_TS_DATAFRAME, predictions=predictions)
+        TimeSeriesPredictor(path=temp_model_path, log_to_file=False).plot(DUMMY_TS_DATAFRAME, predictions=predictions)
 
 
 def test_given_skip_model_selection_when_multiple_models_provided_then_exception_is_raised(temp_model_path):
@@ -1265,20 +1265,31 @@ def test_given_skip_model_selection_when_search_space_provided_then_exception_is
         )
 
 
-@pytest.mark.parametrize("hyperparameters", [{"RecursiveTabular": {}}, {"Chronos": {"model_path": "tiny"}}])
+@pytest.fixture(params=["RecursiveTabular", "Chronos"])
+def single_model_hyperparameters(request, hf_model_path):
+    if request.param == "Chronos":
+        # load Chronos from the local snapshot cached once per session instead of resolving it on the Hugging Face Hub
+        return {"Chronos": {"model_path": hf_model_path}}
+    return {request.param: {}}
+
+
 @pytest.mark.parametrize("tuning_data", [None, DUMMY_TS_DATAFRAME])
-def test_given_skip_model_selection_then_predictor_can_fit_predict(temp_model_path, hyperparameters, tuning_data):
+def test_given_skip_model_selection_then_predictor_can_fit_predict(
+    temp_model_path, single_model_hyperparameters, tuning_data
+):
     predictor = TimeSeriesPredictor(prediction_length=10, path=temp_model_path).fit(
-        DUMMY_TS_DATAFRAME, tuning_data=tuning_data, skip_model_selection=True, hyperparameters=hyperparameters
+        DUMMY_TS_DATAFRAME,
+        tuning_data=tuning_data,
+        skip_model_selection=True,
+        hyperparameters=single_model_hyperparameters,
     )
     predictions = predictor.predict(DUMMY_TS_DATAFRAME)
-    assert all(predictions.item_ids == DUMMY_TS_DATAFRAME.item_ids)
+    assert all(predictions.item_ids == DUMMY_ITEM_IDS)
 
 
-@pytest.mark.parametrize("hyperparameters", [{"RecursiveTabular": {}}, {"Chronos": {"model_path": "tiny"}}])
-def test_given_skip_model_selection_then_all_predictor_methods_work(temp_model_path, hyperparameters):
+def test_given_skip_model_selection_then_all_predictor_methods_work(temp_model_path, single_model_hyperparameters):
     predictor = TimeSeriesPredictor(prediction_length=10, path=temp_model_path).fit(
-        DUMMY_TS_DATAFRAME, skip_model_selection=True, hyperparameters=hyperparameters
+        DUMMY_TS_DATAFRAME, skip_model_selection=True, hyperparameters=single_model_hyperparameters
     )
 
     assert predictor.model_best is not None
@@ -1297,84 +1308,85 @@ def test_given_skip_model_selection_then_all_predictor_methods_work(temp_model_p
             assert len(fit_summary[key]) == 1
 
 
-@pytest.mark.parametrize("hyperparameters", [{"Naive": {}}, {"SeasonalNaive": {}}, {"Naive": {}, "SeasonalNaive": {}}])
-def test_when_persist_called_then_at_least_one_model_persisted(temp_model_path, hyperparameters):
-    predictor = TimeSeriesPredictor(path=temp_model_path).fit(
-        DUMMY_TS_DATAFRAME,
-        hyperparameters=hyperparameters,
-        enable_ensemble=False,
-    )
-    predictor.persist()
-
-    assert len(predictor._learner.trainer.models) > 0
-
-
-@pytest.mark.parametrize("hyperparameters", [{"Naive": {}}, {"SeasonalNaive": {}}, {"Naive": {}, "SeasonalNaive": {}}])
-def test_when_predictor_saved_loaded_and_persist_called_then_at_least_one_model_persisted(
-    temp_model_path, hyperparameters
+def test_when_multiple_predictors_use_same_chronos_model_then_pretrained_weights_are_loaded_once(
+    temp_model_path, hf_model_path
 ):
-    predictor = TimeSeriesPredictor(path=temp_model_path).fit(
-        DUMMY_TS_DATAFRAME,
-        hyperparameters=hyperparameters,
-        enable_ensemble=False,
-    )
-    path = predictor.path
-    predictor.save()
-    predictor = TimeSeriesPredictor.load(path)
-    predictor.persist()
+    # imported here to keep torch and transformers out of the test collection of this module
+    from autogluon.timeseries.models.chronos.pipeline import _load_pretrained_weights
 
-    assert len(predictor._learner.trainer.models) > 0
+    _load_pretrained_weights.cache_clear()
+    for i in range(2):
+        predictor = TimeSeriesPredictor(path=Path(temp_model_path) / str(i), prediction_length=3)
+        predictor.fit(
+            DUMMY_TS_DATAFRAME, hyperparameters={"Chronos": {"model_path": hf_model_path, "context_length": 16}}
+        )
+        predictor.predict(DUMMY_TS_DATAFRAME)
+    assert _load_pretrained_weights.cache_info().misses == 1
 
 
-@pytest.mark.parametrize("hyperparameters", [{"Naive": {}}, {"SeasonalNaive": {}}, {"Naive": {}, "SeasonalNaive": {}}])
-def test_when_persist_not_called_then_no_models_persisted(temp_model_path, hyperparameters):
-    predictor = TimeSeriesPredictor(path=temp_model_path).fit(
-        DUMMY_TS_DATAFRAME,
-        hyperparameters=hyperparameters,
+@pytest.fixture(scope="module", params=PERSIST_TEST_HYPERPARAMETERS)
+def freshly_fitted_persist_test_predictor(request, tmp_path_factory, prepared_dummy_ts_dataframe):
+    return TimeSeriesPredictor(path=tmp_path_factory.mktemp(str(uuid4())[:6])).fit(
+        prepared_dummy_ts_dataframe,
+        hyperparameters=request.param,
         enable_ensemble=False,
     )
 
-    assert len(predictor._learner.trainer.models) == 0
 
+@pytest.fixture()
+def fitted_persist_test_predictor(freshly_fitted_persist_test_predictor):
+    """Predictor right after fit (i.e., with the trainer in memory), shared by all tests with the same hyperparameters.
 
-@pytest.mark.parametrize("hyperparameters", [{"Naive": {}}, {"SeasonalNaive": {}}, {"Naive": {}, "SeasonalNaive": {}}])
-def test_when_predictor_saved_loaded_and_persist_not_called_then_no_models_persisted(temp_model_path, hyperparameters):
-    predictor = TimeSeriesPredictor(path=temp_model_path).fit(
-        DUMMY_TS_DATAFRAME,
-        hyperparameters=hyperparameters,
-        enable_ensemble=False,
-    )
-    path = predictor.path
-    predictor.save()
-    predictor = TimeSeriesPredictor.load(path)
-
-    assert len(predictor._learner.load_trainer().models) == 0
+    Models are unpersisted after each test, so that the persisted models don't leak into the next test.
+    """
+    yield freshly_fitted_persist_test_predictor
+    freshly_fitted_persist_test_predictor.unpersist()
 
 
-@pytest.mark.parametrize("hyperparameters", [{"Naive": {}}, {"SeasonalNaive": {}}, {"Naive": {}, "SeasonalNaive": {}}])
-def test_when_predictor_persisted_saved_loaded_and_persist_not_called_then_no_models_persisted(
-    temp_model_path, hyperparameters
+@pytest.mark.parametrize(
+    "actions, expected_models_persisted",
+    [
+        ([], False),
+        (["persist"], True),
+        (["save", "load", "persist"], True),
+        (["save", "load"], False),
+        (["persist", "save", "load"], False),
+    ],
+)
+def test_when_persist_save_and_load_called_then_models_are_persisted_only_until_predictor_is_loaded(
+    fitted_persist_test_predictor, actions, expected_models_persisted
 ):
-    predictor = TimeSeriesPredictor(path=temp_model_path).fit(
-        DUMMY_TS_DATAFRAME,
-        hyperparameters=hyperparameters,
-        enable_ensemble=False,
-    )
-    path = predictor.path
-    predictor.persist()
+    predictor = fitted_persist_test_predictor
+    for action in actions:
+        if action == "load":
+            predictor = TimeSeriesPredictor.load(predictor.path)
+        else:
+            getattr(predictor, action)()
+        if action == "persist":
+            assert len(predictor._learner.load_trainer().models) > 0
 
-    assert len(predictor._learner.load_trainer().models) > 0
+    num_persisted_models = len(predictor._learner.load_trainer().models)
+    if expected_models_persisted:
+        assert num_persisted_models > 0
+    else:
+        assert num_persisted_models == 0
 
-    predictor.save()
-    predictor = TimeSeriesPredictor.load(path)
 
-    assert len(predictor._learner.load_trainer().models) == 0
+def test_when_predictor_loaded_then_models_are_not_loaded_until_needed(fitted_predictor_cache):
+    predictor = fitted_predictor_cache(PERSIST_TEST_HYPERPARAMETERS[2])
+    assert predictor._learner.trainer is None
 
+    with mock.patch("autogluon.timeseries.trainer.AbstractTimeSeriesTrainer.load_model") as mock_load_model:
+        assert set(predictor.model_names()) >= {"Naive", "SeasonalNaive"}
+        mock_load_model.assert_not_called()
 
-@pytest.mark.parametrize("hyperparameters", [{"Naive": {}}, {"SeasonalNaive": {}}, {"Naive": {}, "SeasonalNaive": {}}])
-def test_when_persist_called_then_persisted_models_names_are_returned(temp_model_path, hyperparameters):
+
+@pytest.mark.parametrize("hyperparameters", PERSIST_TEST_HYPERPARAMETERS)
+def test_when_persist_called_then_persisted_models_names_are_returned(
+    temp_model_path, prepared_dummy_ts_dataframe, hyperparameters
+):
     predictor = TimeSeriesPredictor(path=temp_model_path).fit(
-        DUMMY_TS_DATAFRAME,
+        prepared_dummy_ts_dataframe,
         hyperparameters=hyperparameters,
         enable_ensemble=False,
     )
@@ -1383,23 +1395,24 @@ def test_when_persist_called_then_persisted_models_names_are_returned(temp_model
     assert set(persisted_models).issubset(set(hyperparameters.keys()))
 
 
-@pytest.mark.parametrize("hyperparameters", [{"Naive": {}}, {"SeasonalNaive": {}}, {"Naive": {}, "SeasonalNaive": {}}])
+@pytest.mark.parametrize("hyperparameters", PERSIST_TEST_HYPERPARAMETERS)
 def test_when_persist_and_unpersisted_called_then_persisted_and_unpersisted_models_names_are_returned(
-    temp_model_path, hyperparameters
+    temp_model_path, prepared_dummy_ts_dataframe, hyperparameters
 ):
     predictor = TimeSeriesPredictor(path=temp_model_path).fit(
-        DUMMY_TS_DATAFRAME,
+        prepared_dummy_ts_dataframe,
         hyperparameters=hyperparameters,
         enable_ensemble=False,
     )
     persisted_models = predictor.persist()
+    trainer = predictor._learner.load_trainer()
 
     assert set(persisted_models).issubset(set(hyperparameters.keys()))
 
     unpersisted_models = predictor.unpersist()
 
     assert set(unpersisted_models) == set(persisted_models)
-    assert len(predictor._learner.load_trainer().models) == 0
+    assert len(trainer.models) == 0
 
 
 def _add_ensemble_to_predictor(predictor, hyperparameters, make_best_model=True):
@@ -1418,127 +1431,98 @@ def _add_ensemble_to_predictor(predictor, hyperparameters, make_best_model=True)
     return predictor
 
 
-@pytest.mark.parametrize("hyperparameters", [{"Naive": {}}, {"SeasonalNaive": {}}])
+@pytest.fixture(scope="module")
+def fitted_naive_seasonal_predictor(tmp_path_factory, prepared_dummy_ts_dataframe):
+    hyperparameters = PERSIST_TEST_HYPERPARAMETERS[2]
+    predictor = TimeSeriesPredictor(path=tmp_path_factory.mktemp(str(uuid4())[:6])).fit(
+        prepared_dummy_ts_dataframe,
+        hyperparameters=hyperparameters,
+        enable_ensemble=False,
+    )
+    return _add_ensemble_to_predictor(predictor, hyperparameters)
+
+
+@pytest.fixture()
+def naive_seasonal_predictor_with_ensemble(fitted_naive_seasonal_predictor):
+    """Predictor with Naive, SeasonalNaive and a WeightedEnsemble of both, shared by all tests in the module.
+
+    Models are unpersisted after each test, so that the persisted models don't leak into the next test. Models that
+    are only referenced from reference cycles are freed with gc.collect before the next test starts.
+    """
+    yield fitted_naive_seasonal_predictor
+    fitted_naive_seasonal_predictor.unpersist()
+    gc.collect()
+
+
+@pytest.mark.parametrize("hyperparameters", PERSIST_TEST_HYPERPARAMETERS[:2])
 def test_given_single_model_with_ensemble_when_predictor_persisted_then_only_one_model_persisted(
-    temp_model_path, hyperparameters
+    temp_model_path, prepared_dummy_ts_dataframe, hyperparameters
 ):
     predictor = TimeSeriesPredictor(path=temp_model_path).fit(
-        DUMMY_TS_DATAFRAME,
+        prepared_dummy_ts_dataframe,
         hyperparameters=hyperparameters,
         enable_ensemble=False,
     )
     predictor = _add_ensemble_to_predictor(predictor, hyperparameters, make_best_model=False)
 
-    predictor.persist()
-    assert len(predictor._learner.load_trainer().models) == 1
+    predictor.persist(models="best", with_ancestors=True)
+    trainer = predictor._learner.load_trainer()
+    assert len(trainer.models) == 1
 
     predictor.unpersist()
-    assert len(predictor._learner.load_trainer().models) == 0
+    assert len(trainer.models) == 0
 
 
 @pytest.mark.parametrize(
-    "hyperparameters",
+    "models, expected_persisted_models",
     [
-        {"Naive": {}, "SeasonalNaive": {}},
-        {"Naive": {}, "DeepAR": {"max_epochs": 1}},
+        ("all", {"Naive", "SeasonalNaive", "WeightedEnsemble"}),
+        ("best", {"Naive", "SeasonalNaive", "WeightedEnsemble"}),
+        (["Naive"], {"Naive"}),
     ],
 )
-def test_given_multiple_models_with_ensemble_when_predictor_all_persisted_then_all_models_persisted(
-    temp_model_path, hyperparameters
+def test_given_multiple_models_with_ensemble_when_predictor_persisted_then_expected_models_persisted(
+    naive_seasonal_predictor_with_ensemble, models, expected_persisted_models
 ):
-    predictor = TimeSeriesPredictor(path=temp_model_path).fit(
-        DUMMY_TS_DATAFRAME,
-        hyperparameters=hyperparameters,
-        enable_ensemble=False,
-    )
-    predictor = _add_ensemble_to_predictor(predictor, hyperparameters)
+    predictor = naive_seasonal_predictor_with_ensemble
 
-    print(predictor._learner.load_trainer().get_model_names())
-    persisted_models = predictor.persist("all")
-    assert len(predictor._learner.load_trainer().models) == len(hyperparameters) + 1
-    assert any(m == "WeightedEnsemble" for m in persisted_models)
+    persisted_models = predictor.persist(models=models, with_ancestors=True)
+    trainer = predictor._learner.load_trainer()
+    assert set(persisted_models) == expected_persisted_models
+    assert set(trainer.models) == expected_persisted_models
 
     predictor.unpersist()
-    assert len(predictor._learner.load_trainer().models) == 0
+    assert len(trainer.models) == 0
 
 
-def test_given_multiple_models_with_ensemble_when_predictor_persisted_then_ensemble_and_dependencies_persisted(
-    temp_model_path,
+def test_given_deep_learning_model_with_ensemble_when_predictor_all_persisted_then_all_models_persisted(
+    temp_model_path, prepared_dummy_ts_dataframe
 ):
-    hyperparameters = {"Naive": {}, "SeasonalNaive": {}}
+    hyperparameters = {"Naive": {"n_jobs": 1}, "DeepAR": {"max_epochs": 1}}
     predictor = TimeSeriesPredictor(path=temp_model_path).fit(
-        DUMMY_TS_DATAFRAME,
+        prepared_dummy_ts_dataframe,
         hyperparameters=hyperparameters,
         enable_ensemble=False,
     )
     predictor = _add_ensemble_to_predictor(predictor, hyperparameters)
 
-    persisted_models = predictor.persist()
-    assert len(predictor._learner.load_trainer().models) == len(hyperparameters) + 1
+    persisted_models = predictor.persist("all")
+    trainer = predictor._learner.load_trainer()
+    assert len(trainer.models) == len(hyperparameters) + 1
     assert any(m == "WeightedEnsemble" for m in persisted_models)
 
     predictor.unpersist()
-    assert len(predictor._learner.load_trainer().models) == 0
+    assert len(trainer.models) == 0
 
 
 @pytest.mark.parametrize("with_ancestors", [True, False])
 def test_given_multiple_models_with_ensemble_when_ensemble_persisted_then_persist_obeys_with_ancestors(
-    temp_model_path, with_ancestors
+    naive_seasonal_predictor_with_ensemble, with_ancestors
 ):
-    hyperparameters = {"Naive": {}, "SeasonalNaive": {}}
-    predictor = TimeSeriesPredictor(path=temp_model_path).fit(
-        DUMMY_TS_DATAFRAME,
-        hyperparameters=hyperparameters,
-        enable_ensemble=False,
-    )
-    predictor = _add_ensemble_to_predictor(predictor, hyperparameters)
-
+    predictor = naive_seasonal_predictor_with_ensemble
     persisted_models = predictor.persist(with_ancestors=with_ancestors)
+    assert "WeightedEnsemble" in persisted_models
     assert len(predictor._learner.load_trainer().models) == 1 + (2 if with_ancestors else 0)
-    assert any(m == "WeightedEnsemble" for m in persisted_models)
-
-    predictor.unpersist()
-    assert len(predictor._learner.load_trainer().models) == 0
-
-
-def test_given_multiple_models_with_ensemble_when_predictor_persisted_saved_loaded_then_ensemble_and_dependencies_persisted(
-    temp_model_path,
-):
-    hyperparameters = {"Naive": {}, "SeasonalNaive": {}}
-    predictor = TimeSeriesPredictor(path=temp_model_path).fit(
-        DUMMY_TS_DATAFRAME,
-        hyperparameters=hyperparameters,
-        enable_ensemble=False,
-    )
-    predictor = _add_ensemble_to_predictor(predictor, hyperparameters)
-    predictor.save()
-
-    path = predictor.path
-    predictor = TimeSeriesPredictor.load(path)
-
-    persisted_models = predictor.persist()
-    assert len(predictor._learner.load_trainer().models) == len(hyperparameters) + 1
-    assert any(m == "WeightedEnsemble" for m in persisted_models)
-
-    predictor.unpersist()
-    assert len(predictor._learner.load_trainer().models) == 0
-
-
-def test_given_multiple_models_with_ensemble_when_single_model_persisted_then_single_model_persisted(temp_model_path):
-    hyperparameters = {"Naive": {}, "SeasonalNaive": {}}
-    predictor = TimeSeriesPredictor(path=temp_model_path).fit(
-        DUMMY_TS_DATAFRAME,
-        hyperparameters=hyperparameters,
-        enable_ensemble=False,
-    )
-    predictor = _add_ensemble_to_predictor(predictor, hyperparameters)
-
-    persisted_models = predictor.persist(["Naive"])
-    assert len(predictor._learner.load_trainer().models) == 1
-    assert persisted_models[0] == "Naive"
-
-    predictor.unpersist()
-    assert len(predictor._learner.load_trainer().models) == 0
 
 
 @pytest.fixture(